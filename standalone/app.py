@@ -96,8 +96,9 @@ class App(QMainWindow):
         self._play_timer = None
         self._playback_max_beat = 0
 
-        # Coalesced refresh state
+        # Coalesced refresh state: notify() sources seen since the last refresh
         self._refresh_pending = False
+        self._refresh_sources = set()
 
         self._setup_theme()
         self._build_ui()
@@ -475,6 +476,7 @@ class App(QMainWindow):
             self._push_undo(source)
 
         # Coalesce UI refresh — schedule once, skip if already pending
+        self._refresh_sources.add(source)
         self._schedule_refresh()
 
     def _schedule_refresh(self):
@@ -491,18 +493,24 @@ class App(QMainWindow):
     def _do_deferred_refresh(self):
         """Execute the coalesced refresh."""
         self._refresh_pending = False
-        self._refresh_all()
+        sources, self._refresh_sources = self._refresh_sources, set()
+        self._refresh_all(None if None in sources else sources)
+
+    def _refresh_all(self, sources=None):
+        """Refresh all UI components from current state.
 
-    def _refresh_all(self):
-        """Refresh all UI components from current state."""
+        ``sources`` is the set of notify() reasons being handled, letting
+        components skip work those changes cannot affect; None refreshes
+        everything.
+        """
         self._switch_editor()
         self.topbar.refresh()
-        self.pattern_list.refresh()
-        self.arrangement.refresh()
+        self.pattern_list.refresh(sources)
+        self.arrangement.refresh(sources)
         if self._current_editor == 'piano_roll':
             self.piano_roll.refresh()
         else:
-            self.beat_grid.refresh()
+            self.beat_grid.refresh(sources)
         self.track_panel.refresh()
     
     def _push_undo(self, source=None):
@@ -803,12 +811,12 @@ class App(QMainWindow):
     def load_sf2(self):
         """Open dialog to select and load a soundfont."""
         sf2_list = scan_directory(self.instruments_dir)
-        dlg = SF2Dialog(self, self, sf2_list if sf2_list else [])
-        if dlg.exec():
-            self.state.sf2 = dlg.result
-            if self.engine and dlg.result:
+        sf2 = SF2Dialog.choose(self, self, sf2_list)
+        if sf2:
+            self.state.sf2 = sf2
+            if self.engine:
                 from .ops.export import _get_sf2_path
-                sf2_path = _get_sf2_path(dlg.result)
+                sf2_path = _get_sf2_path(sf2)
                 if sf2_path:
                     self.engine.load_sf2(sf2_path)
             self.state.notify('sf2_loaded')
@@ -933,7 +941,7 @@ class App(QMainWindow):
             return
 
         self.state.playhead = beat
-        self.arrangement.refresh()
+        self.arrangement.refresh_playhead()
         self.piano_roll.grid_widget.update()  # Update piano roll for background notes
 
     def _stop_playhead_timer(self):
@@ -996,7 +1004,7 @@ class App(QMainWindow):
             else:
                 self.state.playhead = current_beat
                 QTimer.singleShot(30, update)
-            self.arrangement.refresh()
+            self.arrangement.refresh_playhead()
 
         update()
 
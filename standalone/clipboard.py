@@ -176,54 +176,43 @@ def select_placements_in_rect(rect: QRectF, state, bw: float, th: float) -> Tupl
     Returns:
         (selected_placements, selected_beat_placements)
     """
-    selected_pls = []
-    selected_bps = []
-    
     # Convert rect to beat coordinates
     t1 = rect.left() / bw
     t2 = rect.right() / bw
     track1 = int(rect.top() / th)
     track2 = int(rect.bottom() / th)
     
+    # Ids of the tracks inside the selected band; one pass over the
+    # placements then replaces the per-track rescans of all placements.
+    beat_track_offset = len(state.tracks)
+    track_ids = {t.id for i, t in enumerate(state.tracks)
+                 if track1 <= i <= track2}
+    beat_track_ids = {t.id for i, t in enumerate(state.beat_tracks)
+                      if track1 <= beat_track_offset + i <= track2}
+    
     # Check melodic placements
-    for i, track in enumerate(state.tracks):
-        if i < track1 or i > track2:
-            continue
-            
+    selected_pls = []
+    if track_ids:
         for pl in state.placements:
-            if pl.track_id != track.id:
+            if pl.track_id not in track_ids or pl.time >= t2:
                 continue
-                
             pat = state.find_pattern(pl.pattern_id)
             if not pat:
                 continue
-                
-            pl_start = pl.time
-            pl_end = pl.time + pat.length * (pl.repeats or 1)
-            
             # Check if placement intersects selection time range
-            if pl_end > t1 and pl_start < t2:
+            if pl.time + pat.length * (pl.repeats or 1) > t1:
                 selected_pls.append(pl)
                 
     # Check beat placements
-    beat_track_offset = len(state.tracks)
-    for i, track in enumerate(state.beat_tracks):
-        track_idx = beat_track_offset + i
-        if track_idx < track1 or track_idx > track2:
-            continue
-            
+    selected_bps = []
+    if beat_track_ids:
         for bp in state.beat_placements:
-            if bp.track_id != track.id:
+            if bp.track_id not in beat_track_ids or bp.time >= t2:
                 continue
-                
             pat = state.find_beat_pattern(bp.pattern_id)
             if not pat:
                 continue
-                
-            bp_start = bp.time
-            bp_end = bp.time + pat.length * (bp.repeats or 1)
-            
-            if bp_end > t1 and bp_start < t2:
+            if bp.time + pat.length * (bp.repeats or 1) > t1:
                 selected_bps.append(bp)
                 
     return selected_pls, selected_bps
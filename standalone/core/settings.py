@@ -21,6 +21,7 @@ DEFAULTS = {
     'sample_rate': 44100,
     'midi_input_device': '',   # empty string = none selected
     'sf2_path': '',            # empty string = no default soundfont
+    'last_sf2_dir': '',        # where the SF2 browse dialog last picked a file
     'autosave_interval': 60,   # seconds; 0 to disable
     # 'binding'    = C++ engine in-process via pybind11 (default, fastest)
     # 'server'     = C++ audio_server process via IPC (fallback / headless)
@@ -37,6 +38,7 @@ class Settings:
         self.sample_rate: int = DEFAULTS['sample_rate']
         self.midi_input_device: str = DEFAULTS['midi_input_device']
         self.sf2_path: str = DEFAULTS['sf2_path']
+        self.last_sf2_dir: str = DEFAULTS['last_sf2_dir']
         self.autosave_interval: int = DEFAULTS['autosave_interval']
         self.audio_backend: str = DEFAULTS['audio_backend']
         self.server_address: str = DEFAULTS['server_address']
@@ -52,6 +54,7 @@ class Settings:
             self.sample_rate = int(d.get('sample_rate', self.sample_rate))
             self.midi_input_device = str(d.get('midi_input_device', self.midi_input_device))
             self.sf2_path = str(d.get('sf2_path', self.sf2_path))
+            self.last_sf2_dir = str(d.get('last_sf2_dir', self.last_sf2_dir))
             self.autosave_interval = int(d.get('autosave_interval', self.autosave_interval))
             self.audio_backend = str(d.get('audio_backend', self.audio_backend))
             self.server_address = str(d.get('server_address', self.server_address))
@@ -68,6 +71,7 @@ class Settings:
                     'sample_rate': self.sample_rate,
                     'midi_input_device': self.midi_input_device,
                     'sf2_path': self.sf2_path,
+                    'last_sf2_dir': self.last_sf2_dir,
                     'autosave_interval': self.autosave_interval,
                     'audio_backend': self.audio_backend,
                     'server_address': self.server_address,
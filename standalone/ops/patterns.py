@@ -68,7 +68,7 @@ def add_beat_pattern(state):
     """
     grid = {}
     for inst in state.beat_kit:
-        grid[inst.id] = [0] * (state.ts_num * 4)
+        grid[inst.id] = bytearray(state.ts_num * 4)
     pat = BeatPattern(
         id=state.new_id(),
         name=f'Beat {len(state.beat_patterns) + 1}',
@@ -95,7 +95,7 @@ def duplicate_beat_pattern(state, pid):
         length=pat.length,
         subdivision=pat.subdivision,
         color=pat.color,
-        grid={k: list(v) for k, v in pat.grid.items()},
+        grid={k: bytearray(v) for k, v in pat.grid.items()},
     )
     state.beat_patterns.append(new_pat)
     state.sel_beat_pat = new_pat.id
@@ -162,12 +162,23 @@ def key_shift(from_key, to_key):
     return ((note_pc(to_key) - note_pc(from_key)) % 12 + 12) % 12
 
 
+# (preset list, {(bank, program): name}) for the most recently queried list;
+# holding the list keeps the identity check valid
+_preset_index = (None, {})
+
+
 def preset_name(bank, program, sf2_presets=None):
     """Get the name for a bank/program combination."""
+    global _preset_index
     if sf2_presets:
-        for p in sf2_presets:
-            if p['bank'] == bank and p['program'] == program:
-                return p['name']
+        if _preset_index[0] is not sf2_presets:
+            names = {}
+            for p in sf2_presets:
+                names.setdefault((p['bank'], p['program']), p['name'])
+            _preset_index = (sf2_presets, names)
+        name = _preset_index[1].get((bank, program))
+        if name is not None:
+            return name
     if 0 <= program < len(GM_NAMES):
         return GM_NAMES[program]
     return f'B{bank}/P{program}'
@@ -175,6 +186,12 @@ def preset_name(bank, program, sf2_presets=None):
 
 def vel_color(v):
     """Convert velocity (1-127) to an RGB hex color string."""
+    if type(v) is int and 0 <= v < 128:
+        return _VEL_COLOR_TABLE[v]
+    return _vel_color(v)
+
+
+def _vel_color(v):
     t = v / 127
     if t < 0.33:
         u = t / 0.33
@@ -188,6 +205,10 @@ def vel_color(v):
     return f'#{max(0,min(255,r)):02x}{max(0,min(255,g)):02x}{max(0,min(255,b)):02x}'
 
 
+# Velocities are MIDI ints in practice; vel_color serves those from this table
+_VEL_COLOR_TABLE = [_vel_color(v) for v in range(128)]
+
+
 @dataclass
 class Note:
     pitch: int
@@ -253,7 +274,7 @@ class BeatPattern:
     length: float
     subdivision: int
     color: str
-    grid: dict  # {instrument_id (str): [velocity per step]}
+    grid: dict  # {instrument_id (int): bytearray of velocity (0-127) per step}
 
     def to_dict(self):
         return {
@@ -266,7 +287,7 @@ class BeatPattern:
     def from_dict(d):
         grid = {}
         for k, v in d.get('grid', {}).items():
-            grid[int(k)] = list(v)
+            grid[int(k)] = bytearray(max(0, min(127, int(x))) for x in v)
         return BeatPattern(
             id=d['id'], name=d['name'], length=d['length'],
             subdivision=d.get('subdivision', 4),
@@ -1,13 +1,113 @@
 """Arrangement timeline canvas - track lanes, placements, and playhead."""
 
+import math
+from functools import lru_cache
+
 from PySide6.QtWidgets import QFrame, QWidget, QScrollArea, QVBoxLayout, QHBoxLayout, QScrollBar
-from PySide6.QtCore import Qt, QRect, QPoint, QSize
-from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont
+from PySide6.QtCore import Qt, QRect, QPoint, QSize, QTimer, QLine
+from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QPixmap
 
-from ..state import preset_name
+from ..state import preset_name, key_shift
 from ..clipboard import MarqueeSelection, ArrangementClipboard, select_placements_in_rect
 
 
+# Paint resources shared by every ArrangementCanvas repaint
+BG_DARK = QColor('#1a1a30')
+BG_STRIPE = QColor('#181828')
+GRID_LINE = QColor('#222244')
+GRID_MEASURE_PEN = QPen(QColor('#3a3a7a'), 1)
+GRID_SUB_PEN = QPen(QColor('#1e1e3a'), 0.5)
+SELECTED_PEN = QPen(QColor('#fff'), 2)
+HIGHLIGHT_PEN = QPen(QColor('#00ff88'), 2)
+REPEAT_PEN = QPen(QColor(255, 255, 255, 68), 1, Qt.DashLine)
+HANDLE_BRUSH = QColor(255, 255, 255, 68)
+NOTE_PREVIEW_BRUSH = QColor(255, 255, 255, 85)
+LABEL_COLOR = QColor('#fff')
+LABEL_FONT = QFont('TkDefaultFont', 8)
+GHOST_PEN = QPen(QColor('#fff'), 1, Qt.DashLine)
+GHOST_LABEL_COLOR = QColor(255, 255, 255, 120)
+LOOP_DIM = QColor(0, 0, 0, 60)
+LOOP_PEN = QPen(QColor('#00b4d8'), 1.5, Qt.DashLine)
+PLAYHEAD_PEN = QPen(QColor('#ff3355'), 2)
+MARQUEE_PEN = QPen(QColor('#00ff88'), 1, Qt.DashLine)
+MARQUEE_BRUSH = QBrush(QColor(0, 255, 136, 30))
+MIN_LABEL_WIDTH = 20    # narrower blocks skip their label
+MIN_PREVIEW_WIDTH = 40  # narrower blocks skip the mini note preview
+TRACK_SEL_BG = QColor('#1e2040')
+TRACK_SEL_PEN = QPen(QColor('#e94560'), 3)
+TRACK_NAME_COLOR = QColor('#eee')
+TRACK_NAME_FONT = QFont('TkDefaultFont', 9, QFont.Bold)
+TRACK_INFO_FONT = QFont('TkDefaultFont', 7)
+
+# Pattern color -> (solid, placement fill, ghost fill). Keyed by the color
+# string, so editing a pattern's color simply misses and builds a new entry.
+_pattern_qcolors = {}
+
+
+def pattern_qcolors(color):
+    """Return cached (solid, alpha 136, alpha 80) QColors for a pattern color."""
+    cached = _pattern_qcolors.get(color)
+    if cached is None:
+        base = QColor(color)
+        fill = QColor(base)
+        fill.setAlpha(136)  # 0x88
+        ghost = QColor(base)
+        ghost.setAlpha(80)
+        cached = _pattern_qcolors[color] = (base, fill, ghost)
+    return cached
+
+
+@lru_cache(maxsize=1024)
+def placement_label(name, key, transpose, target_key):
+    """Block label for a placement of pattern ``name`` (in ``key``).
+
+    Mirrors AppState.compute_transpose; cached by value, so renames,
+    transposes and key changes simply produce a new entry.
+    """
+    pk = key or 'C'
+    label = name
+    ts = (transpose or 0) + key_shift(pk, target_key or pk)
+    if ts:
+        label += f' ({ts:+d})'
+    if target_key and target_key != pk:
+        label += f' -> {target_key}'
+    return label
+
+
+def draw_block_label(painter, x, y, w, th, text):
+    """Draw a placement label clipped to its block.
+
+    Placements are culled by their block extent, so a label spilling past
+    the right edge would be partly erased by a narrow repaint (e.g. the
+    playhead strip) that skips its block.
+    """
+    painter.save()
+    painter.setClipRect(int(x), y + 2, int(w - 1), th - 4)
+    painter.setPen(LABEL_COLOR)
+    painter.drawText(int(x + 4), y + 20, text)
+    painter.restore()
+
+
+def measure_beats(bpm_beats):
+    """Beats per measure as an int when whole (e.g. 4/4, 6/8), else None.
+
+    Whole measures let grid loops test measure lines with an integer modulo
+    instead of a float modulo and tolerance.
+    """
+    bpm_i = round(bpm_beats)
+    return bpm_i if bpm_i > 0 and abs(bpm_beats - bpm_i) < 1e-6 else None
+
+
+# notify() sources that only change which placement/track is selected;
+# these repaint the canvas and labels without recomputing the extent
+SELECTION_SOURCES = frozenset({
+    'sel_pl', 'sel_beat_pl', 'sel_trk', 'sel_beat_trk', 'selection_changed',
+})
+
+# notify() sources that edit a pattern's notes in place; these drop the
+# cached mini note previews
+NOTE_SOURCES = frozenset({'note_add', 'note_edit'})
+
 
 class ArrangementView(QFrame):
     """Arrangement timeline with track labels, canvas, and timeline header."""
@@ -32,6 +132,25 @@ class ArrangementView(QFrame):
 
         # Dynamic extent tracking
         self._max_scroll_beats = self.MIN_BEATS
+
+        # Coalesced refresh state
+        self._refresh_pending = False
+        self._playhead_x = None  # canvas x of the playhead last invalidated
+
+        # Snap value and its reciprocal, see _snap()
+        self._snap_step = None
+        self._snap_inv = 1.0
+
+        # Throttled placement drag: latest (x, y) awaiting _flush_drag()
+        self._pending_drag = None
+        self._drag_scheduled = False
+
+        # Per-track placement buckets for hit testing: (key, {track_id: [pl]})
+        self._pl_index = None
+        self._beat_pl_index = None
+
+        # Rendered mini note previews: pattern id -> (signature, QPixmap)
+        self._preview_cache = {}
         
         # Loop marker drag state
         self._drag_loop_marker = None  # 'start' or 'end'
@@ -132,7 +251,12 @@ class ArrangementView(QFrame):
         self.trk_scroll.verticalScrollBar().setValue(value)
 
     def _snap(self, beat):
-        return round(beat / self.state.snap) * self.state.snap
+        snap = self.state.snap
+        if snap != self._snap_step:
+            # Reciprocal cached per snap value; drags call this per motion
+            self._snap_step = snap
+            self._snap_inv = 1.0 / snap
+        return math.floor(beat * self._snap_inv + 0.5) * snap
 
     def _compute_content_extent(self):
         """Calculate the rightmost beat position of any placement."""
@@ -154,6 +278,67 @@ class ArrangementView(QFrame):
         
         return max_beat
         
+    def _track_buckets(self, beat=False):
+        """Placements grouped by track id, each bucket in list (z) order.
+
+        Rebuilt lazily whenever the placement list is replaced or changes
+        length; in-place track moves (drags) drop the index explicitly.
+        The index holds the list itself, so a replacement list can't be
+        mistaken for the old one by a reused id().
+        """
+        pls = self.state.beat_placements if beat else self.state.placements
+        index = self._beat_pl_index if beat else self._pl_index
+        if index is None or index[0] is not pls or index[1] != len(pls):
+            buckets = {}
+            for pl in pls:
+                buckets.setdefault(pl.track_id, []).append(pl)
+            index = (pls, len(pls), buckets)
+            if beat:
+                self._beat_pl_index = index
+            else:
+                self._pl_index = index
+        return index[2]
+
+    def _invalidate_track_buckets(self):
+        self._pl_index = None
+        self._beat_pl_index = None
+
+    def _note_preview(self, pat):
+        """Mini note preview for a pattern, rendered once into a QPixmap.
+
+        The entry holds the pattern's notes list and is checked by identity,
+        count and pattern length, so undo/redo (which rebuilds patterns) and
+        length edits miss cheaply; in-place note edits clear the cache from
+        refresh() via NOTE_SOURCES. Rendered at the canvas's pixel ratio.
+        """
+        notes = pat.notes
+        dpr = self.canvas_widget.devicePixelRatioF()
+        cached = self._preview_cache.get(pat.id)
+        if (cached is not None and cached[0] is notes
+                and cached[1] == len(notes) and cached[2] == pat.length
+                and cached[3].devicePixelRatio() == dpr):
+            return cached[3]
+
+        BW, TH = self.BW, self.TH
+        pitches = [n.pitch for n in notes]
+        mn, mx = min(pitches), max(pitches)
+        rg = max(1, mx - mn)
+        width = max(int(2 + n.start * BW + max(2, n.duration * BW)) for n in pat.notes) + 1
+        pm = QPixmap(int(width * dpr), int(TH * dpr))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.transparent)
+        p = QPainter(pm)
+        p.setPen(Qt.NoPen)
+        p.setBrush(NOTE_PREVIEW_BRUSH)
+        for n in pat.notes:
+            ny = TH - 6 - ((n.pitch - mn) / rg) * (TH - 12)
+            nx = n.start * BW
+            nw = max(2, n.duration * BW)
+            p.drawRect(int(nx + 2), int(ny), int(nw - 1), 2)
+        p.end()
+        self._preview_cache[pat.id] = (notes, len(notes), pat.length, pm)
+        return pm
+
     def _hit_placement(self, x, y):
         """Hit test for melodic placements. Returns (placement, is_resize_handle)."""
         ti = int(y // self.TH)
@@ -161,9 +346,7 @@ class ArrangementView(QFrame):
         if ti < 0 or ti >= len(self.state.tracks):
             return None, False
         tid = self.state.tracks[ti].id
-        for pl in reversed(self.state.placements):
-            if pl.track_id != tid:
-                continue
+        for pl in reversed(self._track_buckets().get(tid, ())):
             pat = self.state.find_pattern(pl.pattern_id)
             if not pat:
                 continue
@@ -180,9 +363,7 @@ class ArrangementView(QFrame):
         if ti < 0 or ti >= len(self.state.beat_tracks):
             return None, False
         tid = self.state.beat_tracks[ti].id
-        for bp in reversed(self.state.beat_placements):
-            if bp.track_id != tid:
-                continue
+        for bp in reversed(self._track_buckets(beat=True).get(tid, ())):
             pat = self.state.find_beat_pattern(bp.pattern_id)
             if not pat:
                 continue
@@ -192,8 +373,92 @@ class ArrangementView(QFrame):
                 return bp, is_resize
         return None, False
 
-    def refresh(self):
+    def _placement_row(self, pl, beat=False):
+        """Canvas row index of a placement's track, or -1 if it has none."""
+        if beat:
+            tracks, offset = self.state.beat_tracks, len(self.state.tracks)
+        else:
+            tracks, offset = self.state.tracks, 0
+        ti = next((i for i, t in enumerate(tracks) if t.id == pl.track_id), -1)
+        return ti + offset if ti >= 0 else -1
+
+    def _placement_rect(self, pl, beat=False):
+        """Canvas rect a placement's block covers, or None if it isn't shown.
+
+        Padded by the 2px selection/highlight outline, which straddles the
+        block edge. Labels are clipped to the block, so nothing else spills.
+        """
+        row = self._placement_row(pl, beat)
+        find = self.state.find_beat_pattern if beat else self.state.find_pattern
+        pat = find(pl.pattern_id)
+        if row < 0 or not pat:
+            return None
+        x = int(pl.time * self.BW)
+        w = int(pat.length * (pl.repeats or 1) * self.BW)
+        return QRect(x - 2, row * self.TH, w + 4, self.TH)
+
+    def _repaint_placement(self, pl, before, beat=False):
+        """Repaint only where a dragged/resized placement was and now is.
+
+        ``before`` is its _placement_rect() from before the edit. A full
+        refresh() is only needed when the placement now reaches past the
+        scrollable extent.
+        """
+        after = self._placement_rect(pl, beat)
+        for r in (before, after):
+            if r is not None:
+                self.canvas_widget.update(r)
+
+        find = self.state.find_beat_pattern if beat else self.state.find_pattern
+        pat = find(pl.pattern_id)
+        if pat:
+            end_beat = pl.time + pat.length * (pl.repeats or 1)
+            if end_beat * self.LOOKAHEAD_FACTOR > self._max_scroll_beats:
+                self.refresh()
+
+    def refresh(self, sources=None):
+        """Schedule a redraw of all components.
+
+        Drag handlers call this far more often than the screen updates;
+        calls made before the event loop next runs coalesce into a single
+        _do_refresh(). ``sources`` (the notify() reasons, when known) lets
+        selection-only changes skip straight to a repaint.
+        """
+        if sources and sources & NOTE_SOURCES:
+            self._preview_cache.clear()
+        if sources and sources <= SELECTION_SOURCES:
+            self.canvas_widget.update()
+            self.trk_widget.update()
+            return
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._do_refresh)
+
+    def refresh_playhead(self):
+        """Repaint only what the playhead touches: two thin canvas strips
+        (old and new position) and the timeline strip.
+
+        The playback timers call this instead of refresh(); nothing else
+        depends on the playhead position.
+        """
+        s = self.state
+        px = int(s.playhead * self.BW) if s.playing and s.playhead is not None else None
+        if px == self._playhead_x:
+            return
+        ch = self.canvas_widget.height()
+        for x in (self._playhead_x, px):
+            if x is not None:
+                self.canvas_widget.update(QRect(x - 2, 0, 5, ch))
+        self._playhead_x = px
+        self.timeline_widget.update()
+
+    def _do_refresh(self):
         """Redraw all components."""
+        self._refresh_pending = False
+        self._invalidate_track_buckets()
+        if len(self._preview_cache) > len(self.state.patterns):
+            live = {p.id for p in self.state.patterns}
+            self._preview_cache = {k: v for k, v in self._preview_cache.items() if k in live}
         # Calculate dynamic extent based on content and scroll position
         content_extent = self._compute_content_extent()
         
@@ -391,6 +656,7 @@ class TimelineWidget(QWidget):
         
         s = self.parent_arr.state
         bpm_beats = s.ts_num * (4 / s.ts_den)
+        bpm_i = measure_beats(bpm_beats)
         
         # Background
         painter.fillRect(self.rect(), QColor('#16213e'))
@@ -412,7 +678,10 @@ class TimelineWidget(QWidget):
             if x < -50 or x > self.width() + 50:
                 continue
                 
-            is_measure = (abs(b % bpm_beats) < 0.001) or b == 0
+            if bpm_i:
+                is_measure = b % bpm_i == 0
+            else:
+                is_measure = (abs(b % bpm_beats) < 0.001) or b == 0
             if is_measure and b < total_beats:
                 # Calculate absolute measure number from beat position
                 measure_num = int(b / bpm_beats) + 1
@@ -478,6 +747,7 @@ class TrackLabelsWidget(QWidget):
         super().__init__(parent)
         self.parent_arr = parent
         self.setMinimumWidth(150)
+        self._row_cache = {}
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -506,59 +776,77 @@ class TrackLabelsWidget(QWidget):
             if 0 <= bti < len(self.parent_arr.state.beat_tracks):
                 self.parent_arr.app.delete_beat_track(self.parent_arr.state.beat_tracks[bti].id)
 
+    def _row_pixmap(self, name, name_y, lines, sel):
+        """Render one track label row, cached by its displayed content.
+
+        ``lines`` is a tuple of (text, color, y) for the small info lines.
+        Rows are keyed by what they show (and the screen's pixel ratio), so
+        renames, channel/preset changes and selection simply miss the cache.
+        """
+        dpr = self.devicePixelRatioF()
+        key = (name, name_y, lines, sel, dpr)
+        pm = self._row_cache.get(key)
+        if pm is not None:
+            return pm
+
+        TH = self.parent_arr.TH
+        pm = QPixmap(int(150 * dpr), int(TH * dpr))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.transparent)
+        painter = QPainter(pm)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        if sel:
+            painter.fillRect(0, 0, 150, TH, TRACK_SEL_BG)
+            painter.setPen(TRACK_SEL_PEN)
+            painter.drawLine(0, 0, 0, TH)
+
+        painter.setPen(GRID_LINE)
+        painter.drawLine(0, TH - 1, 150, TH - 1)
+
+        painter.setPen(TRACK_NAME_COLOR)
+        painter.setFont(TRACK_NAME_FONT)
+        painter.drawText(8, name_y, name)
+
+        painter.setFont(TRACK_INFO_FONT)
+        for text, color, y in lines:
+            painter.setPen(QColor(color))
+            painter.drawText(8, y, text)
+        painter.end()
+
+        # Keep the cache bounded by dropping stale rows once it outgrows
+        # the visible track count
+        if len(self._row_cache) > 4 * (len(self.parent_arr.state.tracks)
+                                       + len(self.parent_arr.state.beat_tracks)) + 8:
+            self._row_cache.clear()
+        self._row_cache[key] = pm
+        return pm
+
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
         
         s = self.parent_arr.state
         presets = s.sf2.presets if s.sf2 and hasattr(s.sf2, 'presets') else None
         if s.sf2 and isinstance(s.sf2, dict):
             presets = s.sf2.get('presets')
 
+        TH = self.parent_arr.TH
+        exposed = event.rect()
+        r_start = max(0, exposed.top() // TH)
+        r_end = exposed.bottom() // TH + 1
+
         # Draw melodic tracks
-        for i, t in enumerate(s.tracks):
-            y = i * self.parent_arr.TH
-            sel = s.sel_trk == t.id
-            
-            if sel:
-                painter.fillRect(0, y, 150, self.parent_arr.TH, QColor('#1e2040'))
-                painter.setPen(QPen(QColor('#e94560'), 3))
-                painter.drawLine(0, y, 0, y + self.parent_arr.TH)
-            
-            painter.setPen(QColor('#222244'))
-            painter.drawLine(0, y + self.parent_arr.TH - 1, 150, y + self.parent_arr.TH - 1)
-            
-            painter.setPen(QColor('#eee'))
-            painter.setFont(QFont('TkDefaultFont', 9, QFont.Bold))
-            painter.drawText(8, y + 21, t.name)
-            
-            painter.setPen(QColor('#888'))
-            painter.setFont(QFont('TkDefaultFont', 7))
-            painter.drawText(8, y + 33, f'ch{t.channel + 1}')
-            
-            pn = preset_name(t.bank, t.program, presets)
-            painter.drawText(8, y + 45, pn)
+        n_trk = len(s.tracks)
+        for i in range(r_start, min(r_end, n_trk)):
+            t = s.tracks[i]
+            lines = ((f'ch{t.channel + 1}', '#888', 33),
+                     (preset_name(t.bank, t.program, presets), '#888', 45))
+            painter.drawPixmap(0, i * TH, self._row_pixmap(t.name, 21, lines, s.sel_trk == t.id))
 
         # Draw beat tracks
-        for i, bt in enumerate(s.beat_tracks):
-            y = (len(s.tracks) + i) * self.parent_arr.TH
-            sel = s.sel_beat_trk == bt.id
-            
-            if sel:
-                painter.fillRect(0, y, 150, self.parent_arr.TH, QColor('#1e2040'))
-                painter.setPen(QPen(QColor('#e94560'), 3))
-                painter.drawLine(0, y, 0, y + self.parent_arr.TH)
-            
-            painter.setPen(QColor('#222244'))
-            painter.drawLine(0, y + self.parent_arr.TH - 1, 150, y + self.parent_arr.TH - 1)
-            
-            painter.setPen(QColor('#eee'))
-            painter.setFont(QFont('TkDefaultFont', 9, QFont.Bold))
-            painter.drawText(8, y + 23, bt.name)
-            
-            painter.setPen(QColor('#e94560'))
-            painter.setFont(QFont('TkDefaultFont', 7))
-            painter.drawText(8, y + 38, 'Beat Track')
+        for i in range(max(r_start, n_trk), min(r_end, n_trk + len(s.beat_tracks))):
+            bt = s.beat_tracks[i - n_trk]
+            lines = (('Beat Track', '#e94560', 38),)
+            painter.drawPixmap(0, i * TH, self._row_pixmap(bt.name, 23, lines, s.sel_beat_trk == bt.id))
 
 
 class ArrangementCanvas(QWidget):
@@ -766,9 +1054,40 @@ class ArrangementCanvas(QWidget):
             return
         self.parent_arr._on_release(event)
 
+    def _paint_loop_and_playhead(self, painter, s, cw, ch, exposed):
+        """Draw the loop-region shading and the playhead line."""
+        # Loop region shading on canvas
+        if s.looping and s.loop_end is not None:
+            ls = s.loop_start if s.loop_start is not None else 0.0
+            le = s.loop_end
+            lx1 = int(ls * self.parent_arr.BW)
+            lx2 = int(le * self.parent_arr.BW)
+
+            # Dim areas outside the loop
+            if lx1 > 0:
+                painter.fillRect(0, 0, lx1, ch, LOOP_DIM)
+            if lx2 < cw:
+                painter.fillRect(lx2, 0, cw - lx2, ch, LOOP_DIM)
+
+            # Loop boundary lines
+            painter.setPen(LOOP_PEN)
+            painter.drawLine(lx1, 0, lx1, ch)
+            painter.drawLine(lx2, 0, lx2, ch)
+
+        # Playhead (skipped when scrolled outside the exposed area)
+        if s.playing and s.playhead is not None:
+            px = int(s.playhead * self.parent_arr.BW)
+            if exposed.left() - 1 <= px <= exposed.right() + 1:
+                # Draw playhead as a bright red line
+                painter.setPen(PLAYHEAD_PEN)
+                painter.drawLine(px, 0, px, ch)
+
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        # Everything here is axis-aligned; only text needs antialiasing
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        
+        painter.setFont(LABEL_FONT)
         
         s = self.parent_arr.state
         bpm_beats = s.ts_num * (4 / s.ts_den)
@@ -777,229 +1096,204 @@ class ArrangementCanvas(QWidget):
         ch = self.height()
 
         # Background
-        painter.fillRect(self.rect(), QColor('#1a1a30'))
-
-        # Track backgrounds
-        for i in range(total_tracks):
+        painter.fillRect(self.rect(), BG_DARK)
+
+        # Only rows and beats inside the exposed (visible/damaged) area are
+        # drawn; Qt clips to it anyway
+        exposed = event.rect()
+        t_start = max(0, exposed.top() // self.parent_arr.TH)
+        t_end = exposed.bottom() // self.parent_arr.TH + 1
+        vis_left = exposed.left()
+        vis_right = exposed.right()
+
+        # Track backgrounds (row above included for its bottom border)
+        painter.setPen(GRID_LINE)
+        for i in range(max(0, t_start - 1), min(total_tracks, t_end)):
             y = i * self.parent_arr.TH
-            color = QColor('#181828') if i % 2 else QColor('#1a1a30')
-            painter.fillRect(0, y, cw, self.parent_arr.TH, color)
-            painter.setPen(QColor('#222244'))
+            painter.fillRect(0, y, cw, self.parent_arr.TH, BG_STRIPE if i % 2 else BG_DARK)
             painter.drawLine(0, y + self.parent_arr.TH, cw, y + self.parent_arr.TH)
         
         # Beat grid lines
         total_beats = int(self.parent_arr._max_scroll_beats)
-        for b in range(total_beats + 1):
+        b_start = max(0, vis_left // self.parent_arr.BW)
+        b_end = min(total_beats, vis_right // self.parent_arr.BW + 1)
+        bpm_i = measure_beats(bpm_beats)
+        measure_lines, sub_lines = [], []
+        for b in range(b_start, b_end + 1):
             x = b * self.parent_arr.BW
-            is_measure = (abs(b % bpm_beats) < 0.001) or b == 0
-            color = QColor('#3a3a7a') if is_measure else QColor('#1e1e3a')
-            width = 1 if is_measure else 0.5
-            painter.setPen(QPen(color, width))
-            painter.drawLine(x, 0, x, ch)
+            if bpm_i:
+                is_measure = b % bpm_i == 0
+            else:
+                is_measure = (abs(b % bpm_beats) < 0.001) or b == 0
+            (measure_lines if is_measure else sub_lines).append(QLine(x, 0, x, ch))
+        painter.setPen(GRID_SUB_PEN)
+        painter.drawLines(sub_lines)
+        painter.setPen(GRID_MEASURE_PEN)
+        painter.drawLines(measure_lines)
+
+        # Fast path: empty arrangement needs only grid, loop and playhead
+        arr = self.parent_arr
+        if (not s.placements and not s.beat_placements
+                and not arr._ghost_placements and not arr._ghost_beat_placements
+                and not arr.marquee.is_active):
+            self._paint_loop_and_playhead(painter, s, cw, ch, exposed)
+            return
+
+        # Multi-selection highlights are drawn inline with each block
+        sel_ids = {p.id for p in self.parent_arr.selected_placements}
+        sel_beat_ids = {p.id for p in self.parent_arr.selected_beat_placements}
+
+        # Track id -> canvas row, built once per paint (beat rows follow
+        # the melodic ones)
+        n_trk = len(s.tracks)
+        track_rows = {t.id: i for i, t in enumerate(s.tracks)}
+        beat_track_rows = {t.id: n_trk + i for i, t in enumerate(s.beat_tracks)}
+
+        # Note previews resolved once per pattern per paint; repeated
+        # placements of a pattern reuse the pixmap without re-checking it
+        previews = {}
 
         # Melodic placements
         for pl in s.placements:
-            ti = next((i for i, t in enumerate(s.tracks) if t.id == pl.track_id), -1)
+            ti = track_rows.get(pl.track_id, -1)
+            if not t_start <= ti < t_end or pl.time * self.parent_arr.BW > vis_right:
+                continue
             pat = s.find_pattern(pl.pattern_id)
-            if ti < 0 or not pat:
+            if not pat:
                 continue
             y = ti * self.parent_arr.TH
             x = pl.time * self.parent_arr.BW
             tl = pat.length * (pl.repeats or 1)
             w = tl * self.parent_arr.BW
+            if x + w < vis_left:
+                continue
             sel = s.sel_pl == pl.id
 
             # Block with transparency
+            solid, fill, _ = pattern_qcolors(pat.color)
             if sel:
-                painter.setPen(QPen(QColor('#fff'), 2))
-                painter.setBrush(QColor(pat.color))
+                painter.setPen(SELECTED_PEN)
+                painter.setBrush(solid)
             else:
                 painter.setPen(Qt.NoPen)
-                fill_color = QColor(pat.color)
-                fill_color.setAlpha(136)  # 0x88
-                painter.setBrush(fill_color)
+                painter.setBrush(fill)
             
             painter.drawRect(int(x), y + 2, int(w - 1), self.parent_arr.TH - 4)
 
             # Repeat dividers
             for r in range(1, pl.repeats or 1):
                 rx = x + r * pat.length * self.parent_arr.BW
-                painter.setPen(QPen(QColor(255, 255, 255, 68), 1, Qt.DashLine))
+                painter.setPen(REPEAT_PEN)
                 painter.drawLine(int(rx), y + 4, int(rx), y + self.parent_arr.TH - 4)
 
             # Mini note preview
-            if pat.notes:
-                pitches = [n.pitch for n in pat.notes]
-                mn, mx = min(pitches), max(pitches)
-                rg = max(1, mx - mn)
-                for n in pat.notes:
-                    ny = y + self.parent_arr.TH - 6 - ((n.pitch - mn) / rg) * (self.parent_arr.TH - 12)
-                    nx = x + n.start / pat.length * pat.length * self.parent_arr.BW
-                    nw = max(2, n.duration / pat.length * pat.length * self.parent_arr.BW)
-                    painter.setPen(Qt.NoPen)
-                    painter.setBrush(QColor(255, 255, 255, 85))
-                    painter.drawRect(int(nx + 2), int(ny), int(nw - 1), 2)
+            if pat.notes and w >= MIN_PREVIEW_WIDTH:
+                pm = previews.get(pat.id)
+                if pm is None:
+                    pm = previews[pat.id] = self.parent_arr._note_preview(pat)
+                painter.drawPixmap(int(x), y, pm)
 
             # Label
-            label = pat.name
-            ts = s.compute_transpose(pl)
-            if ts:
-                label += f' ({ts:+d})'
-            if pl.target_key and pl.target_key != (pat.key or 'C'):
-                label += f' -> {pl.target_key}'
-            painter.setPen(QColor('#fff'))
-            painter.setFont(QFont('TkDefaultFont', 8))
-            painter.drawText(int(x + 4), y + 20, label)
+            if w >= MIN_LABEL_WIDTH:
+                label = placement_label(pat.name, pat.key, pl.transpose, pl.target_key)
+                draw_block_label(painter, x, y, w, self.parent_arr.TH, label)
 
             # Resize handle
             painter.setPen(Qt.NoPen)
-            painter.setBrush(QColor(255, 255, 255, 68))
+            painter.setBrush(HANDLE_BRUSH)
             painter.drawRect(int(x + w - 5), y + 2, 4, self.parent_arr.TH - 4)
 
+            # Selection highlight
+            if pl.id in sel_ids:
+                painter.setPen(HIGHLIGHT_PEN)
+                painter.setBrush(Qt.NoBrush)
+                painter.drawRect(int(x), y + 2, int(w - 1), self.parent_arr.TH - 4)
+
         # Beat placements
         for bp in s.beat_placements:
-            ti = next((i for i, t in enumerate(s.beat_tracks) if t.id == bp.track_id), -1)
+            ti = beat_track_rows.get(bp.track_id, -1)
+            if not t_start <= ti < t_end or bp.time * self.parent_arr.BW > vis_right:
+                continue
             pat = s.find_beat_pattern(bp.pattern_id)
-            if ti < 0 or not pat:
+            if not pat:
                 continue
-            y = (len(s.tracks) + ti) * self.parent_arr.TH
+            y = ti * self.parent_arr.TH
             x = bp.time * self.parent_arr.BW
             tl = pat.length * (bp.repeats or 1)
             w = tl * self.parent_arr.BW
+            if x + w < vis_left:
+                continue
             sel = s.sel_beat_pl == bp.id
 
+            solid, fill, _ = pattern_qcolors(pat.color)
             if sel:
-                painter.setPen(QPen(QColor('#fff'), 2))
-                painter.setBrush(QColor(pat.color))
+                painter.setPen(SELECTED_PEN)
+                painter.setBrush(solid)
             else:
                 painter.setPen(Qt.NoPen)
-                fill_color = QColor(pat.color)
-                fill_color.setAlpha(136)
-                painter.setBrush(fill_color)
+                painter.setBrush(fill)
             
             painter.drawRect(int(x), y + 2, int(w - 1), self.parent_arr.TH - 4)
 
             for r in range(1, bp.repeats or 1):
                 rx = x + r * pat.length * self.parent_arr.BW
-                painter.setPen(QPen(QColor(255, 255, 255, 68), 1, Qt.DashLine))
+                painter.setPen(REPEAT_PEN)
                 painter.drawLine(int(rx), y + 4, int(rx), y + self.parent_arr.TH - 4)
 
-            painter.setPen(QColor('#fff'))
-            painter.setFont(QFont('TkDefaultFont', 8))
-            painter.drawText(int(x + 4), y + 20, pat.name)
+            if w >= MIN_LABEL_WIDTH:
+                draw_block_label(painter, x, y, w, self.parent_arr.TH, pat.name)
 
             painter.setPen(Qt.NoPen)
-            painter.setBrush(QColor(255, 255, 255, 68))
+            painter.setBrush(HANDLE_BRUSH)
             painter.drawRect(int(x + w - 5), y + 2, 4, self.parent_arr.TH - 4)
 
-        # Loop region shading on canvas
-        if s.looping and s.loop_end is not None:
-            ls = s.loop_start if s.loop_start is not None else 0.0
-            le = s.loop_end
-            lx1 = int(ls * self.parent_arr.BW)
-            lx2 = int(le * self.parent_arr.BW)
-
-            # Dim areas outside the loop
-            outside_color = QColor(0, 0, 0, 60)
-            if lx1 > 0:
-                painter.fillRect(0, 0, lx1, ch, outside_color)
-            if lx2 < cw:
-                painter.fillRect(lx2, 0, cw - lx2, ch, outside_color)
+            if bp.id in sel_beat_ids:
+                painter.setPen(HIGHLIGHT_PEN)
+                painter.setBrush(Qt.NoBrush)
+                painter.drawRect(int(x), y + 2, int(w - 1), self.parent_arr.TH - 4)
 
-            # Loop boundary lines
-            loop_color = QColor('#00b4d8')
-            painter.setPen(QPen(loop_color, 1.5, Qt.DashLine))
-            painter.drawLine(lx1, 0, lx1, ch)
-            painter.drawLine(lx2, 0, lx2, ch)
+        self._paint_loop_and_playhead(painter, s, cw, ch, exposed)
 
-        # Playhead
-        if s.playing and s.playhead is not None:
-            px = s.playhead * self.parent_arr.BW
-            # Draw playhead as a bright red line
-            painter.setPen(QPen(QColor('#ff3355'), 2))
-            painter.drawLine(int(px), 0, int(px), ch)
-        
-        # Draw ghost placements (paste preview)
+        # Draw ghost placements (paste preview), batched per pattern color
         if self.parent_arr._ghost_placements or self.parent_arr._ghost_beat_placements:
             time_offset = self.parent_arr._ghost_offset
-            
-            # Draw ghost melodic placements
-            for pl_dict in self.parent_arr._ghost_placements:
-                ti = next((i for i, t in enumerate(s.tracks) if t.id == pl_dict['trackId']), -1)
-                pat = s.find_pattern(pl_dict['patternId'])
+            TH = self.parent_arr.TH
+            BW = self.parent_arr.BW
+            ghost_rects = {}  # pattern color -> [QRect]
+            ghost_labels = []  # (x, y, text)
+
+            ghosts = [(d, track_rows, s.find_pattern)
+                      for d in self.parent_arr._ghost_placements]
+            ghosts += [(d, beat_track_rows, s.find_beat_pattern)
+                       for d in self.parent_arr._ghost_beat_placements]
+            for g_dict, rows, find in ghosts:
+                ti = rows.get(g_dict['trackId'], -1)
+                pat = find(g_dict['patternId'])
                 if ti < 0 or not pat:
                     continue
-                
-                y = ti * self.parent_arr.TH
-                ghost_time = pl_dict['time'] + time_offset
-                x = ghost_time * self.parent_arr.BW
-                w = pat.length * pl_dict.get('repeats', 1) * self.parent_arr.BW
-                
-                # Semi-transparent ghost appearance
-                ghost_color = QColor(pat.color)
-                ghost_color.setAlpha(80)
-                painter.setPen(QPen(QColor('#fff'), 1, Qt.DashLine))
-                painter.setBrush(ghost_color)
-                painter.drawRect(int(x), y + 2, int(w - 1), self.parent_arr.TH - 4)
-                
-                # Label
-                painter.setPen(QColor(255, 255, 255, 120))
-                painter.setFont(QFont('TkDefaultFont', 8))
-                painter.drawText(int(x + 4), y + 20, pat.name)
-            
-            # Draw ghost beat placements
-            for bp_dict in self.parent_arr._ghost_beat_placements:
-                ti = next((i for i, t in enumerate(s.beat_tracks) if t.id == bp_dict['trackId']), -1)
-                pat = s.find_beat_pattern(bp_dict['patternId'])
-                if ti < 0 or not pat:
-                    continue
-                
-                y = (len(s.tracks) + ti) * self.parent_arr.TH
-                ghost_time = bp_dict['time'] + time_offset
-                x = ghost_time * self.parent_arr.BW
-                w = pat.length * bp_dict.get('repeats', 1) * self.parent_arr.BW
-                
-                # Semi-transparent ghost appearance
-                ghost_color = QColor(pat.color)
-                ghost_color.setAlpha(80)
-                painter.setPen(QPen(QColor('#fff'), 1, Qt.DashLine))
-                painter.setBrush(ghost_color)
-                painter.drawRect(int(x), y + 2, int(w - 1), self.parent_arr.TH - 4)
-                
-                painter.setPen(QColor(255, 255, 255, 120))
-                painter.setFont(QFont('TkDefaultFont', 8))
-                painter.drawText(int(x + 4), y + 20, pat.name)
-        
-        # Draw selection highlights
-        for pl in self.parent_arr.selected_placements:
-            ti = next((i for i, t in enumerate(s.tracks) if t.id == pl.track_id), -1)
-            pat = s.find_pattern(pl.pattern_id)
-            if ti >= 0 and pat:
-                y = ti * self.parent_arr.TH
-                x = pl.time * self.parent_arr.BW
-                w = pat.length * (pl.repeats or 1) * self.parent_arr.BW
-                painter.setPen(QPen(QColor('#00ff88'), 2))
-                painter.setBrush(Qt.NoBrush)
-                painter.drawRect(int(x), y + 2, int(w - 1), self.parent_arr.TH - 4)
-        
-        for bp in self.parent_arr.selected_beat_placements:
-            ti = next((i for i, t in enumerate(s.beat_tracks) if t.id == bp.track_id), -1)
-            pat = s.find_beat_pattern(bp.pattern_id)
-            if ti >= 0 and pat:
-                y = (len(s.tracks) + ti) * self.parent_arr.TH
-                x = bp.time * self.parent_arr.BW
-                w = pat.length * (bp.repeats or 1) * self.parent_arr.BW
-                painter.setPen(QPen(QColor('#00ff88'), 2))
-                painter.setBrush(Qt.NoBrush)
-                painter.drawRect(int(x), y + 2, int(w - 1), self.parent_arr.TH - 4)
+
+                y = ti * TH
+                x = (g_dict['time'] + time_offset) * BW
+                w = pat.length * g_dict.get('repeats', 1) * BW
+                ghost_rects.setdefault(pat.color, []).append(
+                    QRect(int(x), y + 2, int(w - 1), TH - 4))
+                ghost_labels.append((int(x + 4), y + 20, pat.name))
+
+            # Semi-transparent ghost appearance
+            painter.setPen(GHOST_PEN)
+            for color, rects in ghost_rects.items():
+                painter.setBrush(pattern_qcolors(color)[2])
+                painter.drawRects(rects)
+
+            painter.setPen(GHOST_LABEL_COLOR)
+            for lx, ly, text in ghost_labels:
+                painter.drawText(lx, ly, text)
         
         # Draw marquee rectangle
         if self.parent_arr.marquee.is_active:
             rect = self.parent_arr.marquee.get_rect()
-            painter.setPen(QPen(QColor('#00ff88'), 1, Qt.DashLine))
-            fill = QColor('#00ff88')
-            fill.setAlpha(30)
-            painter.setBrush(fill)
+            painter.setPen(MARQUEE_PEN)
+            painter.setBrush(MARQUEE_BRUSH)
             painter.drawRect(rect)
 
 
@@ -1055,35 +1349,55 @@ def _on_right_click(self, event):
         return
 
 def _on_drag(self, event):
-    x, y = event.pos().x(), event.pos().y()
+    # Motion events can arrive far faster than the display refreshes; keep
+    # only the latest position and apply it at most once per frame
+    self._pending_drag = (event.pos().x(), event.pos().y())
+    if not self._drag_scheduled:
+        self._drag_scheduled = True
+        QTimer.singleShot(16, self._flush_drag)
+
+def _flush_drag(self):
+    self._drag_scheduled = False
+    if self._pending_drag is None:
+        return
+    x, y = self._pending_drag
+    self._pending_drag = None
     beat = x / self.BW
 
     if self._drag_pl:
+        before = self._placement_rect(self._drag_pl)
         self._drag_pl.time = max(0, self._snap(beat - self._drag_offset))
         ti = int(y // self.TH)
         if 0 <= ti < len(self.state.tracks):
             self._drag_pl.track_id = self.state.tracks[ti].id
-        self.refresh()
+            self._pl_index = None
+        self._repaint_placement(self._drag_pl, before)
     elif self._resize_pl:
+        before = self._placement_rect(self._resize_pl)
         new_len = max(self.state.snap, self._snap(beat - self._resize_pl.time))
         pat = self.state.find_pattern(self._resize_pl.pattern_id)
         if pat:
             self._resize_pl.repeats = max(1, round(new_len / pat.length))
-        self.refresh()
+        self._repaint_placement(self._resize_pl, before)
     elif self._drag_beat_pl:
+        before = self._placement_rect(self._drag_beat_pl, beat=True)
         self._drag_beat_pl.time = max(0, self._snap(beat - self._drag_offset))
         ti = int(y // self.TH) - len(self.state.tracks)
         if 0 <= ti < len(self.state.beat_tracks):
             self._drag_beat_pl.track_id = self.state.beat_tracks[ti].id
-        self.refresh()
+            self._beat_pl_index = None
+        self._repaint_placement(self._drag_beat_pl, before, beat=True)
     elif self._resize_beat_pl:
+        before = self._placement_rect(self._resize_beat_pl, beat=True)
         new_len = max(self.state.snap, self._snap(beat - self._resize_beat_pl.time))
         pat = self.state.find_beat_pattern(self._resize_beat_pl.pattern_id)
         if pat:
             self._resize_beat_pl.repeats = max(1, round(new_len / pat.length))
-        self.refresh()
+        self._repaint_placement(self._resize_beat_pl, before, beat=True)
 
 def _on_release(self, event):
+    # Apply the last throttled motion so the drop lands where released
+    self._flush_drag()
     if self._drag_pl or self._resize_pl:
         self.state.notify('placement_edit')
     if self._drag_beat_pl or self._resize_beat_pl:
@@ -1107,6 +1421,7 @@ def _select_beat_track(self, btid):
 ArrangementView._on_click = _on_click
 ArrangementView._on_right_click = _on_right_click
 ArrangementView._on_drag = _on_drag
+ArrangementView._flush_drag = _flush_drag
 ArrangementView._on_release = _on_release
 ArrangementView._select_track = _select_track
 ArrangementView._select_beat_track = _select_beat_track
@@ -1,12 +1,38 @@
 """Beat grid editor - drum pattern editing on a step sequencer grid."""
 
+import re
+from bisect import bisect_left, bisect_right
+
 from PySide6.QtWidgets import QFrame, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QScrollArea, QWidget
-from PySide6.QtCore import Qt, QRect, QPoint
-from PySide6.QtGui import QPainter, QColor, QPen, QFont
+from PySide6.QtCore import Qt, QRect, QRectF, QPoint, QLine, QTimer
+from PySide6.QtGui import QPainter, QColor, QPen, QFont, QPixmap
 
 from ..state import PALETTE, vel_color
 
 
+# notify() sources that never change the beat grid's cells, rows or columns.
+# Grid edits are included because GridWidget repaints the edited cell itself.
+GRID_STATIC_SOURCES = frozenset({
+    'sel_pl', 'sel_beat_pl', 'sel_trk', 'sel_beat_trk', 'selection_changed',
+    'loop_markers', 'placement_added', 'beat_placement_added',
+    'placement_edit', 'beat_placement_edit', 'placement_settings',
+    'beat_placement_settings', 'del_pl', 'del_beat_pl', 'beat_grid_edit',
+})
+
+# Column line pens, shared by every GridWidget repaint
+MEASURE_PEN = QPen(QColor('#4a4a8a'), 1.5)
+BEAT_PEN = QPen(QColor('#3a3a6a'), 1)
+SUB_PEN = QPen(QColor('#2a2a4a'), 0.5)
+COLUMN_PENS = (SUB_PEN, BEAT_PEN, MEASURE_PEN)  # indexed by column class
+
+# Matches a non-zero step in a bytearray grid row
+_HIT_RE = re.compile(rb'[^\x00]')
+
+# Cell fill per velocity (index 0 unused) and lane color per palette slot
+_VEL_QCOLORS = [QColor(vel_color(v)) for v in range(128)]
+_ROW_QCOLORS = [QColor(c) for c in PALETTE]
+
+
 class BeatGrid(QFrame):
     """Beat grid editor displayed when a beat pattern is selected."""
 
@@ -17,6 +43,10 @@ class BeatGrid(QFrame):
         super().__init__(parent)
         self.app = app
         self.state = app.state
+        # (rows, columns) the grid widget was last sized for, and the
+        # pattern it last showed
+        self._size_key = None
+        self._shown_pat = None
         self._build()
 
     def _build(self):
@@ -65,8 +95,13 @@ class BeatGrid(QFrame):
 
         layout.addWidget(body)
 
-    def refresh(self):
-        """Redraw the beat grid."""
+    def refresh(self, sources=None):
+        """Redraw the beat grid.
+
+        ``sources`` holds the notify() reasons behind this refresh; when they
+        cannot have touched the grid (and the same pattern is shown) only the
+        header is updated. None forces a full redraw.
+        """
         pat = self.state.find_beat_pattern(self.state.sel_beat_pat)
 
         if pat:
@@ -74,8 +109,18 @@ class BeatGrid(QFrame):
         else:
             self.name_label.setText('No beat pattern')
 
+        key = (len(self.state.beat_kit), int(pat.length * pat.subdivision)) if pat else None
+        if key != self._size_key:
+            self._size_key = key
+            self.grid_widget.update_size()
+
+        shown = pat.id if pat else None
+        if (sources is not None and shown == self._shown_pat
+                and sources <= GRID_STATIC_SOURCES):
+            return
+        self._shown_pat = shown
+
         self.lane_widget.update()
-        self.grid_widget.update_size()
         self.grid_widget.update()
 
 
@@ -86,49 +131,71 @@ class LaneWidget(QWidget):
         super().__init__(parent)
         self.parent_grid = parent
         self.scroll_offset = 0
+        self._lanes_pixmap = None
+        self._lanes_key = None
+        # paintEvent fills its whole rect before blitting the lanes
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
         self.setMinimumHeight(200)
 
     def scroll_to(self, value):
         self.scroll_offset = value
         self.update()
 
+    def _lanes(self, RH):
+        """All lane labels rendered once into a pixmap.
+
+        Keyed by the kit's instrument names, the row height and the screen's
+        pixel ratio, so adding, removing or renaming an instrument simply
+        re-renders it.
+        """
+        kit = self.parent_grid.state.beat_kit
+        dpr = self.devicePixelRatioF()
+        key = (tuple(inst.name for inst in kit), RH, dpr)
+        if self._lanes_key != key:
+            pm = QPixmap(int(70 * dpr), int(max(1, len(kit) * RH + 1) * dpr))
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(QColor('#16213e'))
+            p = QPainter(pm)
+            p.setRenderHint(QPainter.Antialiasing)
+            font = QFont()
+            font.setPointSize(7)
+            p.setFont(font)
+            for i, inst in enumerate(kit):
+                y = i * RH
+
+                # Row background
+                p.setPen(QColor('#222244'))
+                p.setBrush(QColor('#16213e'))
+                p.drawRect(0, y, 70, RH)
+
+                # Color dot
+                p.setPen(Qt.NoPen)
+                p.setBrush(_ROW_QCOLORS[i % len(_ROW_QCOLORS)])
+                p.drawEllipse(6, y + RH // 2 - 4, 8, 8)
+
+                # Name
+                p.setPen(QColor('#eee'))
+                p.drawText(18, y + RH // 2 + 4, inst.name)
+            p.end()
+            self._lanes_pixmap = pm
+            self._lanes_key = key
+        return self._lanes_pixmap
+
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        # Background
-        painter.fillRect(self.rect(), QColor('#16213e'))
-
-        state = self.parent_grid.state
-        RH = self.parent_grid.RH
-
-        for i, inst in enumerate(state.beat_kit):
-            y = i * RH - self.scroll_offset
-            if y + RH < 0 or y > self.height():
-                continue
 
-            # Row background
-            painter.setPen(QColor('#222244'))
-            painter.setBrush(QColor('#16213e'))
-            painter.drawRect(0, y, 70, RH)
-
-            # Color dot
-            color = QColor(PALETTE[i % len(PALETTE)])
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(color)
-            painter.drawEllipse(6, y + RH // 2 - 4, 8, 8)
-
-            # Name
-            painter.setPen(QColor('#eee'))
-            font = QFont()
-            font.setPointSize(7)
-            painter.setFont(font)
-            painter.drawText(18, y + RH // 2 + 4, inst.name)
+        # Cached lanes, then plain background below the last lane
+        lanes_h = 0
+        if self.parent_grid.state.beat_kit:
+            pm = self._lanes(self.parent_grid.RH)
+            painter.drawPixmap(0, -self.scroll_offset, pm)
+            lanes_h = max(0, int(pm.height() / pm.devicePixelRatio()) - self.scroll_offset)
+        if lanes_h < self.height():
+            painter.fillRect(0, lanes_h, self.width(), self.height() - lanes_h, QColor('#16213e'))
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
-            y = event.pos().y() + self.scroll_offset
-            row = int(y // self.parent_grid.RH)
+            row = (event.pos().y() + self.scroll_offset) // self.parent_grid.RH
             state = self.parent_grid.state
             if 0 <= row < len(state.beat_kit):
                 self.parent_grid.app.play_beat_hit(state.beat_kit[row].id)
@@ -141,6 +208,23 @@ class GridWidget(QWidget):
         super().__init__(parent)
         self.parent_grid = parent
         self.setMouseTracking(False)
+        # paintEvent covers every exposed pixel (background pixmap or fill),
+        # so Qt can skip erasing the backing store before each paint
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self._edit_pending = False  # deferred 'beat_grid_edit' notify queued
+        # Click-drag stroke: velocity being written (0 erases, None when
+        # idle), last cell visited, and whether the stroke changed anything
+        self._paint_vel = None
+        self._paint_cell = None
+        self._paint_changed = False
+        # Column line classes, see _column_classes()
+        self._col_classes = b''
+        self._col_key = None
+        self._col_lines = ()
+        self._lines_key = None
+        # Pre-rendered background + row stripes, rebuilt when the key changes
+        self._bg_pixmap = None
+        self._bg_key = None
         self.update_size()
 
     def update_size(self):
@@ -162,75 +246,218 @@ class GridWidget(QWidget):
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        # Cells and lines are axis-aligned, so their outlines are plain
+        # aliased strokes; only the velocity text needs antialiasing
+        painter.setRenderHint(QPainter.TextAntialiasing)
 
         state = self.parent_grid.state
         pat = state.find_beat_pattern(state.sel_beat_pat)
 
-        # Background
-        painter.fillRect(self.rect(), QColor('#1a1a30'))
-
         if not pat:
+            painter.fillRect(self.rect(), QColor('#1a1a30'))
             return
 
-        num_rows = len(state.beat_kit)
+        kit = state.beat_kit
+        num_rows = len(kit)
         num_cols = int(pat.length * pat.subdivision)
         RH = self.parent_grid.RH
         CW = self.parent_grid.CW
         bpm_beats = state.ts_num * (4 / state.ts_den)
 
-        # Row backgrounds
-        for i in range(num_rows):
-            y = i * RH
-            bg = QColor('#181828' if i % 2 else '#1a1a30')
-            painter.fillRect(0, y, self.width(), RH, bg)
-            painter.setPen(QColor('#222244'))
-            painter.drawLine(0, y + RH, self.width(), y + RH)
-
-        # Column lines
-        for col in range(num_cols + 1):
-            x = col * CW
-            beat_num = col / pat.subdivision
-            is_measure = abs(beat_num % bpm_beats) < 0.001 or beat_num == 0
-            is_beat = col % pat.subdivision == 0
-
-            if is_measure:
-                color, width = QColor('#4a4a8a'), 1.5
-            elif is_beat:
-                color, width = QColor('#3a3a6a'), 1
-            else:
-                color, width = QColor('#2a2a4a'), 0.5
-            
-            pen = QPen(color)
-            pen.setWidthF(width)
-            painter.setPen(pen)
-            painter.drawLine(x, 0, x, num_rows * RH)
-
-        # Grid cells
-        for row, inst in enumerate(state.beat_kit):
-            grid = pat.grid.get(inst.id)
+        # Restrict drawing to the damaged rect (a toggled cell repaints
+        # only itself)
+        r = event.rect()
+        row_min = max(0, r.top() // RH)
+        row_max = min(num_rows, r.bottom() // RH + 1)
+        col_min = max(0, r.left() // CW)
+        col_max = min(num_cols, r.right() // CW + 1)
+
+        # Background and row stripes, blitted from the cached pixmap
+        bg = self._background(num_rows, RH)
+        dpr = bg.devicePixelRatio()
+        painter.drawPixmap(QRectF(r), bg, QRectF(r.x() * dpr, r.y() * dpr,
+                                                 r.width() * dpr, r.height() * dpr))
+
+        # Column lines, one drawLines call per pen over the visible slice
+        # of each prebuilt per-class list
+        col_lines = self._column_lines(num_cols, pat.subdivision, bpm_beats, CW, num_rows * RH)
+        for pen, (cols, lines) in zip(COLUMN_PENS, col_lines):
+            lo = bisect_left(cols, col_min)
+            hi = bisect_right(cols, col_max)
+            if lo < hi:
+                painter.setPen(pen)
+                painter.drawLines(lines[lo:hi])
+
+        # Grid cells: per row, cells are bucketed by velocity and each
+        # bucket issued as one drawRects call
+        labels = []
+        grids = pat.grid
+        cell_w, cell_h = CW - 2, RH - 4
+        show_vel = CW >= 20
+        for row in range(row_min, row_max):
+            grid = grids.get(kit[row].id)
             if not grid:
                 continue
 
+            # The regex engine scans the visible steps in C and yields only
+            # the hits, so sparse rows (the common case) cost O(hits)
             y = row * RH
-            color = QColor(PALETTE[row % len(PALETTE)])
-
-            for col, vel in enumerate(grid):
-                if vel > 0:
-                    x = col * CW
-                    vc = QColor(vel_color(vel))
-                    
-                    painter.setPen(color)
-                    painter.setBrush(vc)
-                    painter.drawRect(x + 1, y + 2, CW - 2, RH - 4)
-                    
-                    # Show velocity if cell is wide enough
-                    if CW >= 20 and vel >= 10:
-                        painter.setPen(QColor('#fff'))
-                        font = QFont()
-                        font.setPointSize(6)
-                        painter.setFont(font)
-                        painter.drawText(x + 4, y + RH - 6, str(vel))
+            buckets = {}
+            for m in _HIT_RE.finditer(grid, col_min, col_max):
+                col = m.start()
+                vel = grid[col]
+                x = col * CW
+                buckets.setdefault(vel, []).append(QRect(x + 1, y + 2, cell_w, cell_h))
+                # Show velocity if cell is wide enough
+                if show_vel and vel >= 10:
+                    labels.append((x + 4, y + RH - 6, str(vel)))
+            if not buckets:
+                continue
+
+            painter.setPen(_ROW_QCOLORS[row % len(_ROW_QCOLORS)])
+            for vel, rects in buckets.items():
+                painter.setBrush(_VEL_QCOLORS[vel])
+                painter.drawRects(rects)
+
+        if labels:
+            painter.setPen(QColor('#fff'))
+            font = QFont()
+            font.setPointSize(6)
+            painter.setFont(font)
+            for x, y, text in labels:
+                painter.drawText(x, y, text)
+
+    def _background(self, num_rows, RH):
+        """Widget background with alternating row stripes, cached as a pixmap
+        at the screen's pixel ratio."""
+        dpr = self.devicePixelRatioF()
+        key = (num_rows, RH, self.width(), self.height(), dpr)
+        if self._bg_key != key:
+            pm = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(QColor('#1a1a30'))
+            p = QPainter(pm)
+            w = self.width()
+            # Only odd rows differ from the base fill
+            stripe = QColor('#181828')
+            for i in range(1, num_rows, 2):
+                p.fillRect(0, i * RH, w, RH, stripe)
+            p.setPen(QColor('#222244'))
+            p.drawLines([QLine(0, y, w, y) for y in range(RH, (num_rows + 1) * RH, RH)])
+            p.end()
+            self._bg_pixmap = pm
+            self._bg_key = key
+        return self._bg_pixmap
+
+    def _column_classes(self, num_cols, sub, bpm_beats):
+        """Per-column line class (0 sub-beat, 1 beat, 2 measure).
+
+        Only depends on the pattern shape and time signature, so it is
+        computed once per (columns, subdivision, beats per measure).
+        """
+        key = (num_cols, sub, bpm_beats)
+        if self._col_key != key:
+            # Beat and measure columns are regular strides, so they are set
+            # with extended-slice assignment (a C-level fill) rather than a
+            # per-column Python loop
+            n = num_cols + 1
+            classes = bytearray(n)
+            classes[::sub] = b'\x01' * len(range(0, n, sub))
+            measure_cols = bpm_beats * sub
+            mc = round(measure_cols)
+            if mc > 0 and abs(measure_cols - mc) < 1e-6:
+                classes[::mc] = b'\x02' * len(range(0, n, mc))
+            else:
+                # Fractional columns per measure: test each column
+                for col in range(n):
+                    beat_num = col / sub
+                    if abs(beat_num % bpm_beats) < 0.001 or beat_num == 0:
+                        classes[col] = 2
+            self._col_classes = classes
+            self._col_key = key
+        return self._col_classes
+
+    def _column_lines(self, num_cols, sub, bpm_beats, CW, grid_h):
+        """Column lines grouped by class: ((cols, QLines) for sub, beat, measure).
+
+        Built from _column_classes() once per pattern shape, cell width and
+        grid height; each cols list is sorted so a paint can bisect out the
+        visible range.
+        """
+        classes = self._column_classes(num_cols, sub, bpm_beats)
+        key = (self._col_key, CW, grid_h)
+        if self._lines_key != key:
+            groups = tuple(([], []) for _ in COLUMN_PENS)
+            for col, cls in enumerate(classes):
+                x = col * CW
+                groups[cls][0].append(col)
+                groups[cls][1].append(QLine(x, 0, x, grid_h))
+            self._col_lines = groups
+            self._lines_key = key
+        return self._col_lines
+
+    def _schedule_edit_notify(self):
+        """Notify 'beat_grid_edit' once for a burst of cell edits.
+
+        Wheel ticks and fast clicks arrive back to back; each notify
+        captures an undo snapshot and marks the engine dirty, so edits made
+        before the event loop goes idle are reported together.
+        """
+        if not self._edit_pending:
+            self._edit_pending = True
+            QTimer.singleShot(0, self._flush_edit_notify)
+
+    def _flush_edit_notify(self):
+        self._edit_pending = False
+        self.parent_grid.state.notify('beat_grid_edit')
+
+    def _set_cell(self, grid, row, col, vel):
+        """Write one cell; notify and repaint only if its value changed.
+
+        Returns whether the cell changed (erasing an empty cell or a wheel
+        tick at the velocity limit is a no-op).
+        """
+        if grid[col] == vel:
+            return False
+        grid[col] = vel
+        if self._paint_vel is None:
+            self._schedule_edit_notify()
+        else:
+            # Mid-stroke: one notify goes out on release
+            self._paint_changed = True
+        self._update_cell(row, col)
+        return True
+
+    def _update_cell(self, row, col):
+        """Schedule a repaint of a single edited cell.
+
+        paintEvent culls to the damaged rect, so only that cell's
+        background, column lines and fill are redrawn.
+        """
+        RH = self.parent_grid.RH
+        CW = self.parent_grid.CW
+        self.update(QRect(col * CW, row * RH, CW, RH))
+
+    def _cell_at(self, x, y, pat):
+        """(row, col, num_cols) of the cell under integer widget coords.
+
+        Returns None outside the kit rows or the pattern's steps.
+        """
+        row = y // self.parent_grid.RH
+        if not 0 <= row < len(self.parent_grid.state.beat_kit):
+            return None
+        num_cols = int(pat.length * pat.subdivision)
+        col = x // self.parent_grid.CW
+        if not 0 <= col < num_cols:
+            return None
+        return row, col, num_cols
+
+    def _grid_row(self, pat, inst, num_cols):
+        """The instrument's step row, created empty if it doesn't exist yet."""
+        grid = pat.grid.get(inst.id)
+        if grid is None:
+            grid = pat.grid[inst.id] = bytearray(num_cols)
+        return grid
 
     def mousePressEvent(self, event):
         state = self.parent_grid.state
@@ -239,40 +466,60 @@ class GridWidget(QWidget):
         if not pat or not state.beat_kit:
             return
 
-        RH = self.parent_grid.RH
-        CW = self.parent_grid.CW
-        
-        x, y = event.pos().x(), event.pos().y()
-        row = int(y // RH)
-        col = int(x // CW)
-
-        if row < 0 or row >= len(state.beat_kit):
-            return
-
-        num_cols = int(pat.length * pat.subdivision)
-        if col < 0 or col >= num_cols:
+        pos = event.pos()
+        cell = self._cell_at(pos.x(), pos.y(), pat)
+        if cell is None:
             return
+        row, col, num_cols = cell
 
         inst = state.beat_kit[row]
-        grid = pat.grid.get(inst.id)
-        if grid is None:
-            # Initialize grid for this instrument if it doesn't exist yet
-            num_steps = int(pat.length * pat.subdivision)
-            pat.grid[inst.id] = [0] * num_steps
-            grid = pat.grid[inst.id]
+        grid = self._grid_row(pat, inst, num_cols)
 
+        # The pressed cell decides the stroke: dragging from an empty cell
+        # paints, from a hit (or with the right button) erases
+        self._paint_changed = False
         if event.button() == Qt.LeftButton:
-            vel = state.default_vel
             if grid[col] > 0:
-                grid[col] = 0
+                self._paint_vel = 0
+                self._set_cell(grid, row, col, 0)
             else:
-                grid[col] = vel
+                self._paint_vel = state.default_vel
+                self._set_cell(grid, row, col, state.default_vel)
                 self.parent_grid.app.play_beat_hit(inst.id)
         elif event.button() == Qt.RightButton:
-            grid[col] = 0
+            self._paint_vel = 0
+            self._set_cell(grid, row, col, 0)
+        self._paint_cell = (row, col)
 
-        self.parent_grid.state.notify('beat_grid_edit')
-        self.update()
+    def mouseMoveEvent(self, event):
+        """Continue a paint/erase stroke into the cell under the cursor."""
+        if self._paint_vel is None:
+            return
+        state = self.parent_grid.state
+        pat = state.find_beat_pattern(state.sel_beat_pat)
+        if not pat:
+            return
+        pos = event.pos()
+        cell = self._cell_at(pos.x(), pos.y(), pat)
+        if cell is None or cell[:2] == self._paint_cell:
+            return
+        row, col, num_cols = cell
+        self._paint_cell = (row, col)
+
+        inst = state.beat_kit[row]
+        grid = self._grid_row(pat, inst, num_cols)
+        if self._paint_vel == 0:
+            self._set_cell(grid, row, col, 0)
+        elif grid[col] == 0:
+            self._set_cell(grid, row, col, self._paint_vel)
+            self.parent_grid.app.play_beat_hit(inst.id)
+
+    def mouseReleaseEvent(self, event):
+        if self._paint_vel is not None and self._paint_changed:
+            self._schedule_edit_notify()
+        self._paint_vel = None
+        self._paint_cell = None
+        self._paint_changed = False
 
     def wheelEvent(self, event):
         """Change velocity of beat under cursor with mouse wheel."""
@@ -282,19 +529,11 @@ class GridWidget(QWidget):
         if not pat or not state.beat_kit:
             return
 
-        RH = self.parent_grid.RH
-        CW = self.parent_grid.CW
-        
-        x, y = event.position().x(), event.position().y()
-        row = int(y // RH)
-        col = int(x // CW)
-
-        if row < 0 or row >= len(state.beat_kit):
-            return
-
-        num_cols = int(pat.length * pat.subdivision)
-        if col < 0 or col >= num_cols:
+        pos = event.position()
+        cell = self._cell_at(int(pos.x()), int(pos.y()), pat)
+        if cell is None:
             return
+        row, col, _ = cell
 
         inst = state.beat_kit[row]
         grid = pat.grid.get(inst.id)
@@ -303,8 +542,5 @@ class GridWidget(QWidget):
 
         # Change velocity by 5 per wheel tick
         delta = 5 if event.angleDelta().y() > 0 else -5
-        grid[col] = max(1, min(127, grid[col] + delta))
-        
-        self.parent_grid.state.notify('beat_grid_edit')
-        self.update()
+        self._set_cell(grid, row, col, max(1, min(127, grid[col] + delta)))
         event.accept()
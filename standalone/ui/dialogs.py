@@ -1,10 +1,74 @@
 """Modal dialogs for the standalone arranger."""
 
+import os
+import time
+
 from PySide6.QtWidgets import (QDialog, QLabel, QLineEdit, QSpinBox, QComboBox, 
-                                QPushButton, QVBoxLayout, QHBoxLayout, QFormLayout)
+                                QPushButton, QVBoxLayout, QHBoxLayout, QFormLayout,
+                                QFileDialog, QDialogButtonBox, QMessageBox)
 from PySide6.QtCore import Qt
 
-from ..state import NOTE_NAMES, SCALES, PALETTE
+from ..state import NOTE_NAMES, SCALES, PALETTE, Pattern, BeatPattern
+from ..core.sf2 import SF2Info
+
+try:
+    import rtmidi
+except ImportError:
+    rtmidi = None
+
+# Beat pattern subdivisions offered by BeatPatternDialog, in combo order
+_SUBDIV_VALUES = (2, 3, 4, 6)
+
+# SCALES and PALETTE are fixed at import time
+_SCALE_NAMES = tuple(SCALES.keys())
+_PALETTE_LEN = len(PALETTE)
+
+# (monotonic time, port names) from the last rtmidi enumeration. Probing
+# ALSA/JACK can stall for a noticeable time, so reopening the config dialog
+# reuses a recent result; the Refresh button forces a new scan.
+_midi_port_cache = None
+_MIDI_PORT_MAX_AGE = 5.0
+
+
+def _list_midi_ports(refresh=False):
+    """Return the rtmidi input port names, cached for a few seconds.
+
+    Requires rtmidi; backend errors propagate to the caller.
+    """
+    global _midi_port_cache
+    now = time.monotonic()
+    if (not refresh and _midi_port_cache is not None
+            and now - _midi_port_cache[0] < _MIDI_PORT_MAX_AGE):
+        return _midi_port_cache[1]
+    midi_in = rtmidi.MidiIn()
+    ports = midi_in.get_ports()
+    # Release the backend client right away
+    del midi_in
+    _midi_port_cache = (now, ports)
+    return ports
+
+
+def _load_sf2(app, path):
+    """Load a soundfont into the engine and publish its info to the state.
+
+    Runs on the GUI thread: the engine swaps its instrument in load_sf2
+    with no lock against the GUI's own engine calls, so it can't safely be
+    moved to a worker. As before, state.sf2 is set from the file even if
+    the engine load fails; failures are reported rather than dropped.
+    """
+    name = os.path.basename(path)
+    try:
+        if app.engine.load_sf2(path) is False:
+            QMessageBox.warning(app, 'SoundFont',
+                                f'The audio engine could not load {name}.')
+    except Exception as e:
+        QMessageBox.warning(app, 'SoundFont', f'Failed to load {name}:\n{e}')
+    try:
+        app.state.sf2 = SF2Info(path)
+    except Exception as e:
+        QMessageBox.warning(app, 'SoundFont', f'Failed to read {name}:\n{e}')
+        return
+    app.state.notify('sf2_loaded')
 
 
 class PatternDialog(QDialog):
@@ -49,7 +113,7 @@ class PatternDialog(QDialog):
         key_layout.addSpacing(8)
         key_layout.addWidget(QLabel('Scale:'))
         self.scale_combo = QComboBox()
-        self.scale_combo.addItems(list(SCALES.keys()))
+        self.scale_combo.addItems(_SCALE_NAMES)
         self.scale_combo.setCurrentText(pat.scale if pat else 'major')
         key_layout.addWidget(self.scale_combo)
         key_layout.addStretch()
@@ -57,25 +121,17 @@ class PatternDialog(QDialog):
         layout.addLayout(key_layout)
 
         # Buttons
-        btn_layout = QHBoxLayout()
-        btn_layout.addStretch()
-        ok_btn = QPushButton('OK')
-        ok_btn.clicked.connect(self._ok)
-        ok_btn.setDefault(True)
-        cancel_btn = QPushButton('Cancel')
-        cancel_btn.clicked.connect(self.reject)
-        btn_layout.addWidget(ok_btn)
-        btn_layout.addWidget(cancel_btn)
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self._ok)
+        buttons.rejected.connect(self.reject)
 
         layout.addStretch()
-        layout.addLayout(btn_layout)
+        layout.addWidget(buttons)
 
         self.name_edit.setFocus()
         self.name_edit.selectAll()
 
     def _ok(self):
-        from ..state import Pattern
-
         name = self.name_edit.text() or 'Pattern'
         length = max(1, self.len_spin.value())
         key = self.key_combo.currentText()
@@ -83,18 +139,22 @@ class PatternDialog(QDialog):
 
         if self.pattern_id:
             pat = self.state.find_pattern(self.pattern_id)
-            if pat:
-                pat.name = name
-                pat.length = length
-                pat.key = key
-                pat.scale = scale
+            if not pat or (pat.name, pat.length, pat.key, pat.scale) == (
+                    name, length, key, scale):
+                # Nothing edited; skip the notify and the repaint it causes
+                self.accept()
+                return
+            pat.name = name
+            pat.length = length
+            pat.key = key
+            pat.scale = scale
         else:
             pat = Pattern(
                 id=self.state.new_id(), 
                 name=name, 
                 length=length,
                 notes=[], 
-                color=PALETTE[len(self.state.patterns) % len(PALETTE)],
+                color=PALETTE[len(self.state.patterns) % _PALETTE_LEN],
                 key=key, 
                 scale=scale,
             )
@@ -136,63 +196,61 @@ class BeatPatternDialog(QDialog):
 
         # Subdivision
         self.subdiv_combo = QComboBox()
-        self.subdiv_combo.addItems(['2', '3', '4', '6'])
-        self.subdiv_combo.setCurrentText(str(pat.subdivision) if pat else '4')
+        self.subdiv_combo.addItems([str(v) for v in _SUBDIV_VALUES])
+        subdiv = pat.subdivision if pat else 4
+        self.subdiv_combo.setCurrentIndex(_SUBDIV_VALUES.index(subdiv) if subdiv in _SUBDIV_VALUES else 0)
         form_layout.addRow('Subdivision:', self.subdiv_combo)
 
         layout.addLayout(form_layout)
 
         # Buttons
-        btn_layout = QHBoxLayout()
-        btn_layout.addStretch()
-        ok_btn = QPushButton('OK')
-        ok_btn.clicked.connect(self._ok)
-        ok_btn.setDefault(True)
-        cancel_btn = QPushButton('Cancel')
-        cancel_btn.clicked.connect(self.reject)
-        btn_layout.addWidget(ok_btn)
-        btn_layout.addWidget(cancel_btn)
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self._ok)
+        buttons.rejected.connect(self.reject)
 
         layout.addStretch()
-        layout.addLayout(btn_layout)
+        layout.addWidget(buttons)
 
         self.name_edit.setFocus()
 
     def _ok(self):
-        from ..state import BeatPattern
-
         name = self.name_edit.text() or 'Beat'
         length = max(1, self.len_spin.value())
-        try:
-            subdiv = int(self.subdiv_combo.currentText())
-        except ValueError:
-            subdiv = 4
+        subdiv = _SUBDIV_VALUES[self.subdiv_combo.currentIndex()]
 
         if self.pattern_id:
             pat = self.state.find_beat_pattern(self.pattern_id)
-            if pat:
-                old_len = int(pat.length * pat.subdivision)
-                new_len = length * subdiv
-                pat.name = name
-                pat.length = length
-                pat.subdivision = subdiv
-                if old_len != new_len:
-                    for inst in self.state.beat_kit:
-                        old_grid = pat.grid.get(inst.id, [])
-                        new_grid = [0] * new_len
-                        for i in range(min(len(old_grid), new_len)):
-                            new_grid[i] = old_grid[i]
-                        pat.grid[inst.id] = new_grid
+            if not pat or (pat.name, pat.length, pat.subdivision) == (
+                    name, length, subdiv):
+                # Nothing edited; skip the notify and the repaint it causes
+                self.accept()
+                return
+            old_len = int(pat.length * pat.subdivision)
+            new_len = length * subdiv
+            pat.name = name
+            pat.length = length
+            pat.subdivision = subdiv
+            if old_len != new_len:
+                # Truncate or zero-extend every stored row in place,
+                # then add rows for kit instruments that have none
+                for grid in pat.grid.values():
+                    if len(grid) > new_len:
+                        del grid[new_len:]
+                    elif len(grid) < new_len:
+                        grid.extend(bytes(new_len - len(grid)))
+                for inst in self.state.beat_kit:
+                    if inst.id not in pat.grid:
+                        pat.grid[inst.id] = bytearray(new_len)
         else:
             grid = {}
             for inst in self.state.beat_kit:
-                grid[inst.id] = [0] * (length * subdiv)
+                grid[inst.id] = bytearray(length * subdiv)
             pat = BeatPattern(
                 id=self.state.new_id(), 
                 name=name, 
                 length=length,
                 subdivision=subdiv,
-                color=PALETTE[len(self.state.beat_patterns) % len(PALETTE)],
+                color=PALETTE[len(self.state.beat_patterns) % _PALETTE_LEN],
                 grid=grid,
             )
             self.state.beat_patterns.append(pat)
@@ -221,11 +279,7 @@ class SF2Dialog(QDialog):
         layout.addWidget(QLabel('Select .sf2 file from instruments/ directory:'))
 
         self.sf2_combo = QComboBox()
-        if sf2_list:
-            names = [sf2.name for sf2 in sf2_list]
-            self.sf2_combo.addItems(names)
-        else:
-            self.sf2_combo.addItem('No .sf2 files found')
+        self.sf2_combo.addItems([sf2.name for sf2 in sf2_list])
         layout.addWidget(self.sf2_combo)
 
         info_label = QLabel('Place .sf2 files in the instruments/ directory')
@@ -235,30 +289,42 @@ class SF2Dialog(QDialog):
         layout.addStretch()
 
         # Buttons
-        btn_layout = QHBoxLayout()
-        btn_layout.addStretch()
-        load_btn = QPushButton('Load')
-        load_btn.clicked.connect(self._load)
-        load_btn.setDefault(True)
-        cancel_btn = QPushButton('Cancel')
-        cancel_btn.clicked.connect(self.reject)
-        btn_layout.addWidget(load_btn)
-        btn_layout.addWidget(cancel_btn)
-
-        layout.addLayout(btn_layout)
+        buttons = QDialogButtonBox(QDialogButtonBox.Cancel)
+        buttons.addButton('Load', QDialogButtonBox.AcceptRole)
+        buttons.accepted.connect(self._load)
+        buttons.rejected.connect(self.reject)
+
+        layout.addWidget(buttons)
+
+    @classmethod
+    def choose(cls, parent, app, sf2_list):
+        """Run the dialog and return the chosen SF2Info, or None.
+
+        With no soundfonts to offer, shows a message instead of building
+        the dialog.
+        """
+        if not sf2_list:
+            QMessageBox.information(parent, 'Load SoundFont',
+                                    'Place .sf2 files in the instruments/ directory first.')
+            return None
+        dlg = cls(parent, app, sf2_list)
+        return dlg.result if dlg.exec() else None
 
     def _load(self):
-        if not self.sf2_list:
-            self.reject()
-            return
-        name = self.sf2_combo.currentText()
-        for sf2 in self.sf2_list:
-            if sf2.name == name:
-                self.result = sf2
-                break
+        # Combo rows are in sf2_list order
+        idx = self.sf2_combo.currentIndex()
+        if 0 <= idx < len(self.sf2_list):
+            self.result = self.sf2_list[idx]
         self.accept()
 
 
+_CONFIG_STYLE = (
+    'QLabel#sf2_path { color: #aaa; }'
+    'QLabel#audio_info { color: #888; font-size: 8pt; }'
+    'QLabel#note { color: #666; font-size: 8pt; }'
+)
+
+
 class ConfigDialog(QDialog):
     """Application configuration dialog.
 
@@ -273,6 +339,8 @@ class ConfigDialog(QDialog):
         self.setWindowTitle('Configuration')
         self.setFixedSize(440, 300)
         self.setModal(True)
+        # One dialog-level sheet instead of a parse per styled label
+        self.setStyleSheet(_CONFIG_STYLE)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(10)
@@ -280,15 +348,21 @@ class ConfigDialog(QDialog):
         form.setLabelAlignment(Qt.AlignRight)
 
         # ---- MIDI input device ----
+        midi_row = QHBoxLayout()
         self.midi_combo = QComboBox()
         self._midi_ports = []
         self._populate_midi_ports()
-        form.addRow('MIDI Input:', self.midi_combo)
+        midi_row.addWidget(self.midi_combo, 1)
+        refresh_btn = QPushButton('Refresh')
+        refresh_btn.setMaximumWidth(70)
+        refresh_btn.clicked.connect(lambda: self._populate_midi_ports(refresh=True))
+        midi_row.addWidget(refresh_btn)
+        form.addRow('MIDI Input:', midi_row)
 
         # ---- Default SF2 ----
         sf2_row = QHBoxLayout()
         self.sf2_label = QLabel(self._short_path(self.settings.sf2_path) or '(none)')
-        self.sf2_label.setStyleSheet('color: #aaa;')
+        self.sf2_label.setObjectName('sf2_path')
         sf2_row.addWidget(self.sf2_label, 1)
         browse_btn = QPushButton('Browse…')
         browse_btn.setMaximumWidth(70)
@@ -305,17 +379,16 @@ class ConfigDialog(QDialog):
         self.backend_combo = QComboBox()
         self.backend_combo.addItem('Built-in C++ (recommended)', 'binding')
         self.backend_combo.addItem('FluidSynth (Python fallback)', 'fluidsynth')
-        for i in range(self.backend_combo.count()):
-            if self.backend_combo.itemData(i) == self.settings.audio_backend:
-                self.backend_combo.setCurrentIndex(i)
-                break
+        idx = self.backend_combo.findData(self.settings.audio_backend)
+        if idx >= 0:
+            self.backend_combo.setCurrentIndex(idx)
         form.addRow('Audio Backend:', self.backend_combo)
 
         # ---- Audio info (read-only) ----
         audio_info = QLabel(
             f'{self.settings.sample_rate} Hz  ·  block {self.settings.block_size}'
         )
-        audio_info.setStyleSheet('color: #888; font-size: 8pt;')
+        audio_info.setObjectName('audio_info')
         form.addRow('Audio:', audio_info)
 
         layout.addLayout(form)
@@ -325,47 +398,51 @@ class ConfigDialog(QDialog):
             '~/.config/sequencer/settings.json and take effect on restart.\n'
             'Backend changes take effect immediately.'
         )
-        note.setStyleSheet('color: #666; font-size: 8pt;')
+        note.setObjectName('note')
         layout.addWidget(note)
 
         layout.addStretch()
 
-        btn_layout = QHBoxLayout()
-        btn_layout.addStretch()
-        ok_btn = QPushButton('OK')
-        ok_btn.clicked.connect(self._ok)
-        ok_btn.setDefault(True)
-        cancel_btn = QPushButton('Cancel')
-        cancel_btn.clicked.connect(self.reject)
-        btn_layout.addWidget(ok_btn)
-        btn_layout.addWidget(cancel_btn)
-        layout.addLayout(btn_layout)
-
-    def _populate_midi_ports(self):
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self._ok)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def _populate_midi_ports(self, refresh=False):
         """Enumerate rtmidi input ports; fall back gracefully if unavailable."""
-        self.midi_combo.clear()
-        self.midi_combo.addItem('(none)')
         self._midi_ports = []
-        try:
-            import rtmidi
-            midi_in = rtmidi.MidiIn()
-            ports = midi_in.get_ports()
+        ports = None
+        if rtmidi is not None:
+            try:
+                ports = _list_midi_ports(refresh)
+            except Exception:
+                pass
+        # Fill the combo in one batch with its change signals held back
+        combo = self.midi_combo
+        combo.blockSignals(True)
+        combo.clear()
+        if ports is None:
+            combo.addItems(('(none)', '(rtmidi not installed)'))
+            combo.setEnabled(False)
+        else:
             self._midi_ports = ports
-            for name in ports:
-                self.midi_combo.addItem(name)
+            combo.addItems(['(none)'] + ports)
+            combo.setEnabled(True)
             # Restore saved selection
             saved = self.settings.midi_input_device
             if saved in ports:
-                self.midi_combo.setCurrentText(saved)
-        except Exception:
-            self.midi_combo.addItem('(rtmidi not installed)')
-            self.midi_combo.setEnabled(False)
+                combo.setCurrentIndex(ports.index(saved) + 1)
+        combo.blockSignals(False)
 
     def _browse_sf2(self):
-        from PySide6.QtWidgets import QFileDialog
+        # Start where the last soundfont came from rather than the cwd
+        start_dir = (self.settings.last_sf2_dir
+                     or os.path.dirname(self._sf2_path)
+                     or str(self.app.instruments_dir))
         path, _ = QFileDialog.getOpenFileName(
-            self, 'Select SoundFont', '', 'SoundFont files (*.sf2);;All files (*.*)')
+            self, 'Select SoundFont', start_dir, 'SoundFont files (*.sf2);;All files (*.*)')
         if path:
+            self.settings.last_sf2_dir = os.path.dirname(path)
             self._sf2_path = path
             self.sf2_label.setText(self._short_path(path))
 
@@ -376,8 +453,7 @@ class ConfigDialog(QDialog):
     @staticmethod
     def _short_path(path):
         """Show just the filename to keep the label compact."""
-        from pathlib import Path as P
-        return P(path).name if path else ''
+        return os.path.basename(path) if path else ''
 
     def _ok(self):
         # MIDI device
@@ -401,16 +477,7 @@ class ConfigDialog(QDialog):
         else:
             # Apply SF2 immediately if it changed and engine is running
             if self._sf2_path and self.app.engine:
-                try:
-                    self.app.engine.load_sf2(self._sf2_path)
-                except Exception:
-                    pass
-                try:
-                    from ..core.sf2 import SF2Info
-                    self.app.state.sf2 = SF2Info(self._sf2_path)
-                    self.app.state.notify('sf2_loaded')
-                except Exception:
-                    pass
+                _load_sf2(self.app, self._sf2_path)
 
         # Notify app so Rec button can update its enabled state
         if hasattr(self.app, '_on_config_changed'):
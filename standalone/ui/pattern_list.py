@@ -1,11 +1,52 @@
 """Left panel - pattern and beat pattern lists with drag support."""
 
 from PySide6.QtWidgets import (QFrame, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, 
-                                QScrollArea, QWidget)
-from PySide6.QtCore import Qt, QMimeData, Signal
-from PySide6.QtGui import QPainter, QColor, QDrag, QFont
+                                QScrollArea, QWidget, QFileDialog, QMessageBox)
+from PySide6.QtCore import Qt, QMimeData, QSize, Signal
+from PySide6.QtGui import QPainter, QColor, QDrag, QFont, QIcon, QPixmap
 
 from ..state import PALETTE
+from ..ops import patterns as pat_ops
+from ..ops import project_io
+
+# Rows have a fixed height so the lists can be windowed: the content height
+# is known up-front and the rows in view follow from the scroll position.
+ROW_H = 36
+ROW_STEP = ROW_H + 1
+# Extra rows kept alive above and below the viewport
+ROW_OVERSCAN = 2
+# Row child geometry (see _place_row)
+DOT_SIZE = 12
+ROW_BTN_W = 26
+NAME_LINE_H = 16
+OVERLAY_ICON_SIZE = 16
+OVERLAY_GLYPH_COLOR = QColor('#aaa')
+
+# Row styles, shared by every item rather than formatted per row
+ITEM_STYLE = 'background-color: #16213e; border: 1px solid #16213e;'
+ITEM_SEL_STYLE = 'background-color: #1e2a4a; border: 1px solid #e94560;'
+CLEAR_STYLE = 'background-color: transparent; border: none;'
+NAME_STYLE = 'color: #eee; background-color: transparent; border: none;'
+INFO_STYLE = 'color: #888; background-color: transparent; border: none;'
+BTN_STYLE = 'background-color: transparent; color: #aaa; border: 1px solid #555; font-size: 16px; padding: 2px;'
+OVERLAY_BTN_STYLE = 'background-color: transparent; color: #aaa; border: 1px solid #555; font-size: 14px; padding: 2px;'
+NAME_FONT = QFont()
+NAME_FONT.setPointSize(9)
+INFO_FONT = QFont()
+INFO_FONT.setPointSize(7)
+
+# notify() sources that never change a pattern row or the selected pattern
+LIST_STATIC_SOURCES = frozenset({
+    'sel_pl', 'sel_beat_pl', 'sel_trk', 'sel_beat_trk', 'selection_changed',
+    'loop_markers', 'placement_added', 'beat_placement_added',
+    'placement_edit', 'beat_placement_edit', 'placement_settings',
+    'beat_placement_settings', 'del_pl', 'del_beat_pl', 'cut_placements',
+    'paste_placements', 'delete_placements', 'track_settings',
+    'beat_track_settings', 'add_track', 'add_beat_track', 'beat_grid_edit',
+    'beat_kit', 'ts',
+})
+# notify() sources raised when a list row is clicked; only the highlight moves
+LIST_SELECTION_SOURCES = frozenset({'sel_pat', 'sel_beat_pat'})
 
 
 class PatternList(QFrame):
@@ -52,15 +93,7 @@ class PatternList(QFrame):
         layout.addWidget(hdr)
 
         # Pattern scroll area
-        self.pat_scroll = QScrollArea()
-        self.pat_scroll.setWidgetResizable(True)
-        self.pat_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.pat_container = QWidget()
-        self.pat_layout = QVBoxLayout(self.pat_container)
-        self.pat_layout.setContentsMargins(0, 0, 0, 0)
-        self.pat_layout.setSpacing(1)
-        self.pat_layout.addStretch()
-        self.pat_scroll.setWidget(self.pat_container)
+        self.pat_scroll = RowList(lambda: PatternItem(self))
         layout.addWidget(self.pat_scroll, stretch=1)
 
         # Key info label
@@ -100,30 +133,49 @@ class PatternList(QFrame):
         bhdr_layout.addWidget(bnew_btn)
         layout.addWidget(bhdr)
 
-        # Beat pattern scroll area
-        self.beat_scroll = QScrollArea()
-        self.beat_scroll.setWidgetResizable(True)
-        self.beat_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.beat_container = QWidget()
-        self.beat_layout = QVBoxLayout(self.beat_container)
-        self.beat_layout.setContentsMargins(0, 0, 0, 0)
-        self.beat_layout.setSpacing(1)
-        self.beat_layout.addStretch()
-        self.beat_scroll.setWidget(self.beat_container)
-        layout.addWidget(self.beat_scroll, stretch=1)
+        # Beat pattern scroll area.  Many projects never use beat patterns,
+        # so a framed placeholder label stands in until one exists
+        self.beat_scroll = None
+        self.beat_empty = QLabel('No beat patterns')
+        self.beat_empty.setFrameShape(QFrame.StyledPanel)
+        self.beat_empty.setFrameShadow(QFrame.Sunken)
+        self.beat_empty.setStyleSheet('color: #666;')
+        self.beat_empty.setFont(font)
+        self.beat_empty.setAlignment(Qt.AlignHCenter | Qt.AlignTop)
+        self.beat_empty.setContentsMargins(0, 10, 0, 0)
+        layout.addWidget(self.beat_empty, stretch=1)
+
+    def _ensure_beat_ui(self):
+        """Swap the beat placeholder for the real list on first use."""
+        if self.beat_scroll is not None:
+            return
+        self.beat_scroll = RowList(lambda: BeatPatternItem(self),
+                                   empty_text='No beat patterns')
+        self.layout().replaceWidget(self.beat_empty, self.beat_scroll)
+        self.beat_empty.deleteLater()
+        self.beat_empty = None
 
     def _new_pattern(self):
-        from ..ops.patterns import add_pattern
-        add_pattern(self.state)
+        pat_ops.add_pattern(self.state)
 
     def _new_beat_pattern(self):
-        from ..ops.patterns import add_beat_pattern
-        add_beat_pattern(self.state)
+        pat_ops.add_beat_pattern(self.state)
+
+    def refresh(self, sources=None):
+        """Rebuild pattern lists from state.
 
-    def refresh(self):
-        """Rebuild pattern lists from state."""
-        self._render_patterns()
-        self._render_beat_patterns()
+        ``sources`` holds the notify() reasons behind this refresh; when they
+        are all in LIST_STATIC_SOURCES nothing shown here can have changed.
+        """
+        if sources and sources <= LIST_STATIC_SOURCES:
+            return
+        if sources and sources <= LIST_SELECTION_SOURCES:
+            self.pat_scroll.set_selected(self.state.sel_pat)
+            if self.beat_scroll is not None:
+                self.beat_scroll.set_selected(self.state.sel_beat_pat)
+        else:
+            self._render_patterns()
+            self._render_beat_patterns()
         # Key info
         pat = self.state.find_pattern(self.state.sel_pat)
         if pat:
@@ -132,38 +184,14 @@ class PatternList(QFrame):
             self.key_info.setText('')
 
     def _render_patterns(self):
-        # Clear existing widgets except stretch
-        while self.pat_layout.count() > 1:
-            item = self.pat_layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
-
-        for pat in self.state.patterns:
-            item = PatternItem(self, pat, self.state.sel_pat == pat.id)
-            self.pat_layout.insertWidget(self.pat_layout.count() - 1, item)
+        self.pat_scroll.set_items(self.state.patterns, self.state.sel_pat)
 
     def _render_beat_patterns(self):
-        # Clear existing widgets except stretch
-        while self.beat_layout.count() > 1:
-            item = self.beat_layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
-
-        if not self.state.beat_patterns:
-            lbl = QLabel('No beat patterns')
-            lbl.setStyleSheet('color: #666;')
-            font = QFont()
-            font.setPointSize(9)
-            lbl.setFont(font)
-            lbl.setAlignment(Qt.AlignCenter)
-            self.beat_layout.insertWidget(0, lbl)
-            return
-
-        for pat in self.state.beat_patterns:
-            item = BeatPatternItem(self, pat, self.state.sel_beat_pat == pat.id)
-            self.beat_layout.insertWidget(self.beat_layout.count() - 1, item)
+        if self.beat_scroll is None:
+            if not self.state.beat_patterns:
+                return
+            self._ensure_beat_ui()
+        self.beat_scroll.set_items(self.state.beat_patterns, self.state.sel_beat_pat)
 
     def _select_pat(self, pid):
         self.state.sel_pat = pid
@@ -186,26 +214,20 @@ class PatternList(QFrame):
         self.state.notify('sel_beat_pat')
 
     def _del_pat(self, pid):
-        from ..ops.patterns import delete_pattern
-        delete_pattern(self.state, pid)
+        pat_ops.delete_pattern(self.state, pid)
 
     def _dup_pat(self, pid):
-        from ..ops.patterns import duplicate_pattern
-        duplicate_pattern(self.state, pid)
+        pat_ops.duplicate_pattern(self.state, pid)
 
     def _del_beat_pat(self, pid):
-        from ..ops.patterns import delete_beat_pattern
-        delete_beat_pattern(self.state, pid)
+        pat_ops.delete_beat_pattern(self.state, pid)
 
     def _dup_beat_pat(self, pid):
-        from ..ops.patterns import duplicate_beat_pattern
-        duplicate_beat_pattern(self.state, pid)
+        pat_ops.duplicate_beat_pattern(self.state, pid)
 
     # ---- Pattern import / export ----
 
     def _export_pattern(self):
-        from PySide6.QtWidgets import QFileDialog, QMessageBox
-        from ..ops.project_io import export_pattern
         pat = self.state.find_pattern(self.state.sel_pat)
         if not pat:
             QMessageBox.warning(self, 'Export', 'No melodic pattern selected.')
@@ -215,11 +237,9 @@ class PatternList(QFrame):
             self, 'Export Pattern', f'{safe_name}.json',
             'Pattern files (*.json);;All files (*.*)')
         if path:
-            export_pattern(pat, path)
+            project_io.export_pattern(pat, path)
 
     def _export_beat_pattern(self):
-        from PySide6.QtWidgets import QFileDialog, QMessageBox
-        from ..ops.project_io import export_beat_pattern
         pat = self.state.find_beat_pattern(self.state.sel_beat_pat)
         if not pat:
             QMessageBox.warning(self, 'Export', 'No beat pattern selected.')
@@ -229,142 +249,308 @@ class PatternList(QFrame):
             self, 'Export Beat Pattern', f'{safe_name}.json',
             'Pattern files (*.json);;All files (*.*)')
         if path:
-            export_beat_pattern(pat, path)
+            project_io.export_beat_pattern(pat, path)
 
     def _import_pattern(self):
-        from PySide6.QtWidgets import QFileDialog, QMessageBox
-        from ..ops.project_io import import_pattern
         path, _ = QFileDialog.getOpenFileName(
             self, 'Import Pattern', '',
             'Pattern files (*.json);;All files (*.*)')
         if path:
             try:
-                import_pattern(self.state, path)
+                project_io.import_pattern(self.state, path)
             except ValueError as e:
                 QMessageBox.warning(self, 'Import Error', str(e))
             except Exception as e:
                 QMessageBox.critical(self, 'Import Error', f'Failed to load: {e}')
 
     def _import_beat_pattern(self):
-        from PySide6.QtWidgets import QFileDialog, QMessageBox
-        from ..ops.project_io import import_beat_pattern
         path, _ = QFileDialog.getOpenFileName(
             self, 'Import Beat Pattern', '',
             'Pattern files (*.json);;All files (*.*)')
         if path:
             try:
-                import_beat_pattern(self.state, path)
+                project_io.import_beat_pattern(self.state, path)
             except ValueError as e:
                 QMessageBox.warning(self, 'Import Error', str(e))
             except Exception as e:
                 QMessageBox.critical(self, 'Import Error', f'Failed to load: {e}')
 
 
+# Color -> 12x12 dot pixmap, shared by every row showing that color
+_DOT_CACHE = {}
+
+
+def _color_dot(color):
+    """Return the cached circular color indicator pixmap for ``color``."""
+    px = _DOT_CACHE.get(color)
+    if px is None:
+        px = QPixmap(12, 12)
+        px.fill(Qt.transparent)
+        painter = QPainter(px)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(color))
+        painter.drawEllipse(2, 2, 8, 8)
+        painter.end()
+        _DOT_CACHE[color] = px
+    return px
+
+
+def _place_row(row, buttons):
+    """Position a pattern row's children for its current size.
+
+    Color dot on the left, name over details beside it, and ``buttons``
+    flush right.
+    """
+    w, h = row.width(), row.height()
+    row.dot_label.setGeometry(6, (h - DOT_SIZE) // 2, DOT_SIZE, DOT_SIZE)
+    x = w - 4
+    for btn in reversed(buttons):
+        x -= ROW_BTN_W
+        btn.setGeometry(x, 4, ROW_BTN_W, h - 8)
+        x -= 2
+    text_x = 6 + DOT_SIZE + 4
+    text_w = max(0, x - 2 - text_x)
+    row.name_label.setGeometry(text_x, 4, text_w, NAME_LINE_H)
+    row.info_label.setGeometry(text_x, 4 + NAME_LINE_H, text_w, h - 8 - NAME_LINE_H)
+    _set_row_name(row)
+
+
+def _set_row_name(row):
+    """Show the bound pattern's name, elided to the name label's width."""
+    if row.pattern is None:
+        return
+    label = row.name_label
+    label.setText(label.fontMetrics().elidedText(
+        row.pattern.name, Qt.ElideRight, label.width()))
+
+
+# Overlay mode glyph -> icon, so the buttons blit a pixmap instead of
+# shaping the glyph text on every repaint
+_OVERLAY_ICONS = {}
+
+
+def _overlay_icon(symbol):
+    """Return the cached overlay button icon showing ``symbol``."""
+    icon = _OVERLAY_ICONS.get(symbol)
+    if icon is None:
+        px = QPixmap(OVERLAY_ICON_SIZE, OVERLAY_ICON_SIZE)
+        px.fill(Qt.transparent)
+        painter = QPainter(px)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        painter.setPen(OVERLAY_GLYPH_COLOR)
+        font = QFont()
+        font.setPixelSize(14)
+        painter.setFont(font)
+        painter.drawText(px.rect(), Qt.AlignCenter, symbol)
+        painter.end()
+        icon = QIcon(px)
+        _OVERLAY_ICONS[symbol] = icon
+    return icon
+
+
+class RowList(QScrollArea):
+    """Scroll area that only keeps row widgets for the items in view.
+
+    ``make_row()`` builds an empty row widget; rows are filled in with
+    ``row.bind(item, selected)``.  Rows are ROW_H tall and placed by hand,
+    so scrolling a long list creates at most a viewport's worth of widgets,
+    and rows leaving the view are pooled and rebound rather than rebuilt.
+    """
+
+    def __init__(self, make_row, empty_text=None):
+        super().__init__()
+        self._make_row = make_row
+        self._items = []
+        self._selected = None
+        self._rows = {}  # item index -> row widget
+        self._pool = []  # hidden rows ready to be rebound
+        self.setWidgetResizable(True)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.container = QWidget()
+        self.setWidget(self.container)
+
+        self._empty_label = None
+        if empty_text:
+            lbl = QLabel(empty_text, self.container)
+            lbl.setStyleSheet('color: #666;')
+            font = QFont()
+            font.setPointSize(9)
+            lbl.setFont(font)
+            lbl.setAlignment(Qt.AlignCenter)
+            self._empty_label = lbl
+
+        self.verticalScrollBar().valueChanged.connect(self._update_window)
+
+    def set_items(self, items, selected_id):
+        """Show ``items``, highlighting the one whose id is ``selected_id``."""
+        self._items = list(items)
+        self._selected = selected_id
+        # Rebind the rows already on screen in place; bind() skips rows
+        # whose content is unchanged, so a selection change only restyles
+        for i in [i for i in self._rows if i >= len(self._items)]:
+            self._release(self._rows.pop(i))
+        for i, row in self._rows.items():
+            item = self._items[i]
+            row.bind(item, item.id == selected_id)
+        self.container.setMinimumHeight(max(0, len(self._items) * ROW_STEP - 1))
+        if self._empty_label:
+            self._empty_label.setVisible(not self._items)
+        self._update_window()
+
+    def set_selected(self, selected_id):
+        """Move the highlight to ``selected_id`` without rebinding rows."""
+        self._selected = selected_id
+        for i, row in self._rows.items():
+            row.set_selected(self._items[i].id == selected_id)
+
+    def _update_window(self, *_):
+        top = self.verticalScrollBar().value()
+        first = max(0, top // ROW_STEP - ROW_OVERSCAN)
+        last = min(len(self._items),
+                   (top + self.viewport().height()) // ROW_STEP + 1 + ROW_OVERSCAN)
+
+        for i in [i for i in self._rows if not first <= i < last]:
+            self._release(self._rows.pop(i))
+
+        width = self.viewport().width()
+        for i in range(first, last):
+            row = self._rows.get(i)
+            if row is None:
+                item = self._items[i]
+                row = self._acquire()
+                row.bind(item, item.id == self._selected)
+                row.show()
+                self._rows[i] = row
+            row.setGeometry(0, i * ROW_STEP, width, ROW_H)
+        if self._empty_label:
+            self._empty_label.setGeometry(0, 0, width, ROW_H)
+
+    def _acquire(self):
+        if self._pool:
+            return self._pool.pop()
+        row = self._make_row()
+        row.setParent(self.container)
+        return row
+
+    def _release(self, row):
+        row.hide()
+        self._pool.append(row)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_window()
+
+
 class PatternItem(QFrame):
-    """Single pattern item in the list."""
+    """Single pattern item in the list.
+
+    Rows are reused by RowList; bind() points one at a pattern.
+    """
 
-    def __init__(self, parent_list, pattern, selected):
+    def __init__(self, parent_list):
         super().__init__(parent_list)
         self.parent_list = parent_list
-        self.pattern = pattern
-        self.setFrameStyle(QFrame.Box if selected else QFrame.NoFrame)
+        self.pattern = None
+        self._selected = None
+        self._shown = None
         self.setCursor(Qt.PointingHandCursor)
         self.drag_start_pos = None
         self.drag_timer = None
-        
-        bg_color = '#1e2a4a' if selected else '#16213e'
-        border_color = '#e94560' if selected else '#16213e'
-        self.setStyleSheet(f'background-color: {bg_color}; border: 1px solid {border_color};')
 
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(6, 4, 4, 4)
-        layout.setSpacing(4)
+        # Children are placed by _place_row() on resize rather than by
+        # layouts: every row has the same fixed structure
 
         # Color dot
-        dot_widget = ColorDot(pattern.color)
-        dot_widget.setAttribute(Qt.WA_TransparentForMouseEvents)
-        layout.addWidget(dot_widget)
-
-        # Text container with two lines
-        text_container = QWidget()
-        text_container.setStyleSheet('background-color: transparent; border: none;')
-        text_container.setAttribute(Qt.WA_TransparentForMouseEvents)
-        text_layout = QVBoxLayout(text_container)
-        text_layout.setContentsMargins(0, 0, 0, 0)
-        text_layout.setSpacing(0)
-        
+        dot_label = QLabel(self)
+        dot_label.setStyleSheet(CLEAR_STYLE)
+        dot_label.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.dot_label = dot_label
+
         # Name on first line
-        name_label = QLabel(pattern.name)
-        name_label.setStyleSheet('color: #eee; background-color: transparent; border: none;')
+        name_label = QLabel(self)
+        name_label.setStyleSheet(NAME_STYLE)
         name_label.setAttribute(Qt.WA_TransparentForMouseEvents)
-        # Prevent text from expanding and enable elision
         name_label.setWordWrap(False)
-        from PySide6.QtWidgets import QSizePolicy
-        name_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Preferred)
-        name_font = QFont()
-        name_font.setPointSize(9)
-        name_label.setFont(name_font)
-        text_layout.addWidget(name_label)
+        name_label.setFont(NAME_FONT)
+        self.name_label = name_label
         
         # Details on second line (smaller font)
-        info = f'{pattern.length}b · {pattern.key} {pattern.scale}'
-        info_label = QLabel(info)
-        info_label.setStyleSheet('color: #888; background-color: transparent; border: none;')
+        info_label = QLabel(self)
+        info_label.setStyleSheet(INFO_STYLE)
         info_label.setAttribute(Qt.WA_TransparentForMouseEvents)
-        info_font = QFont()
-        info_font.setPointSize(7)
-        info_label.setFont(info_font)
-        text_layout.addWidget(info_label)
-        
-        layout.addWidget(text_container, stretch=1)
+        info_label.setFont(INFO_FONT)
+        self.info_label = info_label
 
         # Overlay mode button
-        overlay_btn = QPushButton(self._overlay_symbol(pattern.overlay_mode))
-        overlay_btn.setStyleSheet('background-color: transparent; color: #aaa; border: 1px solid #555; font-size: 14px; padding: 2px;')
-        overlay_btn.setFixedWidth(26)
-        overlay_btn.setToolTip(self._overlay_tooltip(pattern.overlay_mode))
-        overlay_btn.clicked.connect(lambda: self._toggle_overlay(pattern.id))
-        layout.addWidget(overlay_btn)
+        overlay_btn = QPushButton(self)
+        overlay_btn.setStyleSheet(OVERLAY_BTN_STYLE)
+        overlay_btn.setIconSize(QSize(OVERLAY_ICON_SIZE, OVERLAY_ICON_SIZE))
+        overlay_btn.clicked.connect(self._on_overlay)
         self.overlay_btn = overlay_btn
 
-        # Action buttons - fixed width container so buttons don't get pushed off
-        btn_frame = QFrame()
-        btn_frame.setStyleSheet('background-color: transparent; border: none;')
-        btn_frame.setFixedWidth(84)
-        btn_layout = QHBoxLayout(btn_frame)
-        btn_layout.setContentsMargins(0, 0, 0, 0)
-        btn_layout.setSpacing(2)
-
         # Copy button (overlapping squares icon) - with visible border for debugging
-        dup_btn = QPushButton('⧉')
-        dup_btn.setStyleSheet('background-color: transparent; color: #aaa; border: 1px solid #555; font-size: 16px; padding: 2px;')
-        dup_btn.setFixedWidth(26)
+        dup_btn = QPushButton('⧉', self)
+        dup_btn.setStyleSheet(BTN_STYLE)
         dup_btn.setToolTip('Duplicate pattern')
-        dup_btn.clicked.connect(lambda: parent_list._dup_pat(pattern.id))
-        btn_layout.addWidget(dup_btn)
+        dup_btn.clicked.connect(self._on_dup)
 
         # Edit button (quill/pen icon)
-        edit_btn = QPushButton('✎')
-        edit_btn.setStyleSheet('background-color: transparent; color: #aaa; border: 1px solid #555; font-size: 16px; padding: 2px;')
-        edit_btn.setFixedWidth(26)
+        edit_btn = QPushButton('✎', self)
+        edit_btn.setStyleSheet(BTN_STYLE)
         edit_btn.setToolTip('Edit pattern')
-        edit_btn.clicked.connect(lambda: parent_list.app.show_pattern_dialog(pattern.id))
-        btn_layout.addWidget(edit_btn)
+        edit_btn.clicked.connect(self._on_edit)
 
         # Delete button
-        del_btn = QPushButton('✕')
-        del_btn.setStyleSheet('background-color: transparent; color: #aaa; border: 1px solid #555; font-size: 16px; padding: 2px;')
-        del_btn.setFixedWidth(26)
+        del_btn = QPushButton('✕', self)
+        del_btn.setStyleSheet(BTN_STYLE)
         del_btn.setToolTip('Delete pattern')
-        del_btn.clicked.connect(lambda: parent_list._del_pat(pattern.id))
-        btn_layout.addWidget(del_btn)
+        del_btn.clicked.connect(self._on_del)
 
-        layout.addWidget(btn_frame)
+        self._buttons = (overlay_btn, dup_btn, edit_btn, del_btn)
+
+    def bind(self, pattern, selected):
+        """Show ``pattern`` in this row."""
+        self.pattern = pattern
+        self.set_selected(selected)
+        shown = (pattern.name, pattern.color, pattern.length, pattern.key,
+                 pattern.scale, pattern.overlay_mode)
+        if shown == self._shown:
+            return
+        self._shown = shown
+        self.dot_label.setPixmap(_color_dot(pattern.color))
+        _set_row_name(self)
+        self.info_label.setText(f'{pattern.length}b · {pattern.key} {pattern.scale}')
+        self.overlay_btn.setIcon(_overlay_icon(self._overlay_symbol(pattern.overlay_mode)))
+        self.overlay_btn.setToolTip(self._overlay_tooltip(pattern.overlay_mode))
+
+    def set_selected(self, selected):
+        if selected != self._selected:
+            self._selected = selected
+            self.setFrameStyle(QFrame.Box if selected else QFrame.NoFrame)
+            self.setStyleSheet(ITEM_SEL_STYLE if selected else ITEM_STYLE)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        _place_row(self, self._buttons)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self.parent_list._select_pat(self.pattern.id)
 
+    # Button handlers act on whichever pattern the row is bound to
+    def _on_dup(self):
+        self.parent_list._dup_pat(self.pattern.id)
+
+    def _on_edit(self):
+        self.parent_list.app.show_pattern_dialog(self.pattern.id)
+
+    def _on_del(self):
+        self.parent_list._del_pat(self.pattern.id)
+
+    def _on_overlay(self):
+        self._toggle_overlay(self.pattern)
+
     def _overlay_symbol(self, mode):
         """Get symbol for overlay mode."""
         if mode == 'off':
@@ -383,12 +569,8 @@ class PatternItem(QFrame):
         else:  # 'always'
             return 'Overlay: Always On (click to set Off)'
     
-    def _toggle_overlay(self, pattern_id):
+    def _toggle_overlay(self, pat):
         """Cycle through overlay modes."""
-        pat = self.parent_list.state.find_pattern(pattern_id)
-        if not pat:
-            return
-        
         # Cycle: off -> playing -> always -> off
         modes = ['off', 'playing', 'always']
         current_idx = modes.index(pat.overlay_mode) if pat.overlay_mode in modes else 1
@@ -396,7 +578,7 @@ class PatternItem(QFrame):
         pat.overlay_mode = modes[next_idx]
         
         # Update button
-        self.overlay_btn.setText(self._overlay_symbol(pat.overlay_mode))
+        self.overlay_btn.setIcon(_overlay_icon(self._overlay_symbol(pat.overlay_mode)))
         self.overlay_btn.setToolTip(self._overlay_tooltip(pat.overlay_mode))
         
         # Notify state change to trigger piano roll refresh
@@ -404,113 +586,97 @@ class PatternItem(QFrame):
 
 
 class BeatPatternItem(QFrame):
-    """Single beat pattern item in the list."""
+    """Single beat pattern item in the list.
 
-    def __init__(self, parent_list, pattern, selected):
+    Rows are reused by RowList; bind() points one at a beat pattern.
+    """
+
+    def __init__(self, parent_list):
         super().__init__(parent_list)
         self.parent_list = parent_list
-        self.pattern = pattern
-        self.setFrameStyle(QFrame.Box if selected else QFrame.NoFrame)
+        self.pattern = None
+        self._selected = None
+        self._shown = None
         self.setCursor(Qt.PointingHandCursor)
         self.drag_start_pos = None
         self.drag_timer = None
-        
-        bg_color = '#1e2a4a' if selected else '#16213e'
-        border_color = '#e94560' if selected else '#16213e'
-        self.setStyleSheet(f'background-color: {bg_color}; border: 1px solid {border_color};')
 
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(6, 4, 4, 4)
-        layout.setSpacing(4)
+        # Children are placed by _place_row() on resize rather than by
+        # layouts: every row has the same fixed structure
 
         # Color dot
-        dot_widget = ColorDot(pattern.color)
-        dot_widget.setAttribute(Qt.WA_TransparentForMouseEvents)
-        layout.addWidget(dot_widget)
-
-        # Text container with two lines
-        text_container = QWidget()
-        text_container.setStyleSheet('background-color: transparent; border: none;')
-        text_container.setAttribute(Qt.WA_TransparentForMouseEvents)
-        text_layout = QVBoxLayout(text_container)
-        text_layout.setContentsMargins(0, 0, 0, 0)
-        text_layout.setSpacing(0)
-        
+        dot_label = QLabel(self)
+        dot_label.setStyleSheet(CLEAR_STYLE)
+        dot_label.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.dot_label = dot_label
+
         # Name on first line
-        name_label = QLabel(pattern.name)
-        name_label.setStyleSheet('color: #eee; background-color: transparent; border: none;')
+        name_label = QLabel(self)
+        name_label.setStyleSheet(NAME_STYLE)
         name_label.setAttribute(Qt.WA_TransparentForMouseEvents)
-        # Prevent text from expanding and enable elision
         name_label.setWordWrap(False)
-        from PySide6.QtWidgets import QSizePolicy
-        name_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Preferred)
-        name_font = QFont()
-        name_font.setPointSize(9)
-        name_label.setFont(name_font)
-        text_layout.addWidget(name_label)
+        name_label.setFont(NAME_FONT)
+        self.name_label = name_label
         
         # Details on second line (smaller font)
-        info = f'{pattern.length}b · ÷{pattern.subdivision}'
-        info_label = QLabel(info)
-        info_label.setStyleSheet('color: #888; background-color: transparent; border: none;')
+        info_label = QLabel(self)
+        info_label.setStyleSheet(INFO_STYLE)
         info_label.setAttribute(Qt.WA_TransparentForMouseEvents)
-        info_font = QFont()
-        info_font.setPointSize(7)
-        info_label.setFont(info_font)
-        text_layout.addWidget(info_label)
-        
-        layout.addWidget(text_container, stretch=1)
-
-        # Action buttons - fixed width container so buttons don't get pushed off
-        btn_frame = QFrame()
-        btn_frame.setStyleSheet('background-color: transparent; border: none;')
-        btn_frame.setFixedWidth(84)
-        btn_layout = QHBoxLayout(btn_frame)
-        btn_layout.setContentsMargins(0, 0, 0, 0)
-        btn_layout.setSpacing(2)
+        info_label.setFont(INFO_FONT)
+        self.info_label = info_label
 
         # Copy button (overlapping squares icon) - with visible border for debugging
-        dup_btn = QPushButton('⧉')
-        dup_btn.setStyleSheet('background-color: transparent; color: #aaa; border: 1px solid #555; font-size: 16px; padding: 2px;')
-        dup_btn.setFixedWidth(26)
+        dup_btn = QPushButton('⧉', self)
+        dup_btn.setStyleSheet(BTN_STYLE)
         dup_btn.setToolTip('Duplicate pattern')
-        dup_btn.clicked.connect(lambda: parent_list._dup_beat_pat(pattern.id))
-        btn_layout.addWidget(dup_btn)
+        dup_btn.clicked.connect(self._on_dup)
 
         # Edit button (quill/pen icon)
-        edit_btn = QPushButton('✎')
-        edit_btn.setStyleSheet('background-color: transparent; color: #aaa; border: 1px solid #555; font-size: 16px; padding: 2px;')
-        edit_btn.setFixedWidth(26)
+        edit_btn = QPushButton('✎', self)
+        edit_btn.setStyleSheet(BTN_STYLE)
         edit_btn.setToolTip('Edit pattern')
-        edit_btn.clicked.connect(lambda: parent_list.app.show_beat_pattern_dialog(pattern.id))
-        btn_layout.addWidget(edit_btn)
+        edit_btn.clicked.connect(self._on_edit)
 
         # Delete button
-        del_btn = QPushButton('✕')
-        del_btn.setStyleSheet('background-color: transparent; color: #aaa; border: 1px solid #555; font-size: 16px; padding: 2px;')
-        del_btn.setFixedWidth(26)
+        del_btn = QPushButton('✕', self)
+        del_btn.setStyleSheet(BTN_STYLE)
         del_btn.setToolTip('Delete pattern')
-        del_btn.clicked.connect(lambda: parent_list._del_beat_pat(pattern.id))
-        btn_layout.addWidget(del_btn)
+        del_btn.clicked.connect(self._on_del)
+
+        self._buttons = (dup_btn, edit_btn, del_btn)
+
+    def bind(self, pattern, selected):
+        """Show ``pattern`` in this row."""
+        self.pattern = pattern
+        self.set_selected(selected)
+        shown = (pattern.name, pattern.color, pattern.length, pattern.subdivision)
+        if shown == self._shown:
+            return
+        self._shown = shown
+        self.dot_label.setPixmap(_color_dot(pattern.color))
+        _set_row_name(self)
+        self.info_label.setText(f'{pattern.length}b · ÷{pattern.subdivision}')
 
-        layout.addWidget(btn_frame)
+    def set_selected(self, selected):
+        if selected != self._selected:
+            self._selected = selected
+            self.setFrameStyle(QFrame.Box if selected else QFrame.NoFrame)
+            self.setStyleSheet(ITEM_SEL_STYLE if selected else ITEM_STYLE)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        _place_row(self, self._buttons)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self.parent_list._select_beat_pat(self.pattern.id)
 
+    # Button handlers act on whichever pattern the row is bound to
+    def _on_dup(self):
+        self.parent_list._dup_beat_pat(self.pattern.id)
 
-class ColorDot(QWidget):
-    """Small circular color indicator."""
-
-    def __init__(self, color):
-        super().__init__()
-        self.color = QColor(color)
-        self.setFixedSize(12, 12)
+    def _on_edit(self):
+        self.parent_list.app.show_beat_pattern_dialog(self.pattern.id)
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(self.color)
-        painter.drawEllipse(2, 2, 8, 8)
+    def _on_del(self):
+        self.parent_list._del_beat_pat(self.pattern.id)
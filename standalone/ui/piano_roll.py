@@ -1,16 +1,108 @@
 """Piano roll editor - note editing on a pitch/time grid."""
 
 import time
+from bisect import bisect_left
 
 from PySide6.QtWidgets import (QFrame, QWidget, QScrollArea, QLabel, QPushButton,
                                 QComboBox, QSlider, QVBoxLayout, QHBoxLayout)
 from PySide6.QtCore import Qt, QRect, QPoint, QRectF
-from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QKeyEvent
+from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QKeyEvent, QPixmap
 
 from ..state import NOTE_NAMES, scale_set, vel_color, Note
 from ..clipboard import NoteClipboard
 
 
+# Per pitch class: (is_black, is_c, name)
+_PC_META = tuple(('#' in NOTE_NAMES[pc], pc == 0, NOTE_NAMES[pc]) for pc in range(12))
+
+
+def _device_pixmap(widget, fill):
+    """Opaque widget-sized pixmap at the screen's device pixel ratio."""
+    dpr = widget.devicePixelRatioF()
+    pm = QPixmap(int(widget.width() * dpr), int(widget.height() * dpr))
+    pm.setDevicePixelRatio(dpr)
+    pm.fill(fill)
+    return pm
+
+
+def _blit(painter, rect, pm):
+    """Copy the exposed ``rect`` (logical coords) out of a cached pixmap."""
+    dpr = pm.devicePixelRatio()
+    painter.drawPixmap(QRectF(rect), pm,
+                       QRectF(rect.x() * dpr, rect.y() * dpr,
+                              rect.width() * dpr, rect.height() * dpr))
+
+
+def _in_key_mask(pat):
+    """Pattern's scale as a 12-bit mask, bit ``pc`` set for in-key pitch classes."""
+    if not pat:
+        return 0
+    mask = 0
+    for pc in scale_set(pat.key, pat.scale):
+        mask |= 1 << pc
+    return mask
+
+
+# Keyboard (PianoKeysWidget)
+KEY_BLACK_IN = QColor('#2a1a50')
+KEY_BLACK = QColor('#111')
+KEY_WHITE_IN = QColor('#2e2450')
+KEY_WHITE = QColor('#16213e')
+KEY_BORDER = QColor('#1a1a2e')
+KEY_C_TEXT = QColor('#eee')
+KEY_C_LINE = QColor('#533483')
+KEY_TEXT = QColor('#888')
+KEY_C_FONT = QFont('TkDefaultFont', 6)
+KEY_FONT = QFont('TkDefaultFont', 5)
+
+# Grid rows and beat lines (PianoGridWidget background)
+ROW_BLACK_IN = QColor('#1e1a40')
+ROW_BLACK = QColor('#15152a')
+ROW_WHITE_IN = QColor('#252050')
+ROW_WHITE = QColor('#1a1a30')
+ROW_C_PEN = QPen(QColor('#3a3a6a'), 1)
+ROW_PEN = QPen(QColor('#222244'), 0.5)
+MEASURE_PEN = QPen(QColor('#4a4a8a'), 1.5)
+BEAT_PEN = QPen(QColor('#3a3a6a'), 1)
+HALF_BEAT_PEN = QPen(QColor('#2a2a5a'), 0.5)
+SUBDIV_PEN = QPen(QColor('#222244'), 0.5)
+
+# Overlays: pitch bend, slice preview, marquee and ghost notes
+BEND_CURVE_PEN = QPen(QColor(0x00, 0xf5, 0xd4, 200), 1.5)
+BEND_HANDLE_PEN = QPen(QColor('#000'), 1)
+BEND_HANDLE = QColor('#00f5d4')
+BEND_HANDLE_DRAG = QColor('#fee440')
+BEND_ZERO_PEN = QPen(QColor(255, 255, 255, 40), 1, Qt.DashLine)
+SLICE_PEN = QPen(QColor('#ff0000'), 2)
+MARQUEE_PEN = QPen(QColor('#ffffff'), 1, Qt.DashLine)
+MARQUEE_BRUSH = QColor(255, 255, 255, 30)
+GHOST_PEN = QPen(QColor('#ffffff'), 1, Qt.DashLine)
+
+# Current-pattern note drawing, shared by every PianoGridWidget repaint
+NOTE_SEL_PEN = QPen(QColor('#fff'), 2)
+NOTE_HANDLE_BRUSH = QColor(255, 255, 255, 51)
+NOTE_LABEL_COLOR = QColor('#fff')
+NOTE_LABEL_FONT = QFont('TkDefaultFont', 6)
+_VEL_QCOLORS = [QColor(vel_color(v)) for v in range(128)]
+
+
+def _draw_note_run(painter, pen, velocity, bodies, handles, labelled):
+    """Draw note bodies sharing one pen and velocity colour, then their
+    resize handles and, for selected notes, velocity labels."""
+    painter.setPen(pen)
+    painter.setBrush(_VEL_QCOLORS[velocity] if 0 <= velocity < 128
+                     else QColor(vel_color(velocity)))
+    painter.drawRects(bodies)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(NOTE_HANDLE_BRUSH)
+    painter.drawRects(handles)
+    if labelled:
+        painter.setPen(NOTE_LABEL_COLOR)
+        text = f'v{velocity}'
+        for r in bodies:
+            painter.drawText(r.x() + 2, r.y() + r.height() - 2, text)
+
+
 class PianoRoll(QFrame):
     """Piano roll editor with piano keys, note grid, and velocity lane."""
 
@@ -226,12 +318,24 @@ class PianoRoll(QFrame):
             return None, -1, False
         pitch = self.HI - int(y / self.NH)
         beat = x / self.BW
-        for i in range(len(pat.notes) - 1, -1, -1):
-            n = pat.notes[i]
-            if n.pitch == pitch and n.start <= beat < n.start + n.duration:
-                is_resize = beat > n.start + n.duration - 0.15
-                return n, i, is_resize
-        return None, -1, False
+        # Topmost note wins, following the grid's draw order: selected
+        # notes sit above unselected ones, list order within each group.
+        # Pitch is the cheap first filter.
+        notes = pat.notes
+        selected = self._selected
+        unsel_hit = None
+        for i in range(len(notes) - 1, -1, -1):
+            n = notes[i]
+            if n.pitch != pitch:
+                continue
+            end = n.start + n.duration
+            if n.start <= beat < end:
+                hit = (n, i, beat > end - 0.15)
+                if i in selected:
+                    return hit
+                if unsel_hit is None:
+                    unsel_hit = hit
+        return unsel_hit or (None, -1, False)
     
     def _coords_to_beat_pitch(self, x, y):
         """Convert pixel coordinates to (beat, pitch)."""
@@ -569,6 +673,8 @@ class PianoKeysWidget(QWidget):
     def __init__(self, parent):
         super().__init__(parent)
         self.parent_roll = parent
+        self._pixmap = None
+        self._pixmap_key = None
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -579,41 +685,61 @@ class PianoKeysWidget(QWidget):
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        rect = event.rect()
+        _blit(painter, rect, self._keys_pixmap())
 
+    def _keys_pixmap(self):
+        """Keyboard drawing, cached as a pixmap.
+
+        It only changes with the pattern's key/scale, the widget size and
+        the screen's pixel ratio.
+        """
         pat = self.parent_roll.state.find_pattern(self.parent_roll.state.sel_pat)
-        in_key = scale_set(pat.key, pat.scale) if pat else set()
+        cache_key = (pat.key if pat else None, pat.scale if pat else None,
+                     self.width(), self.height(), self.devicePixelRatioF())
+        if self._pixmap_key == cache_key:
+            return self._pixmap
+
+        pm = _device_pixmap(self, KEY_WHITE)
+        painter = QPainter(pm)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        in_key = _in_key_mask(pat)
 
         for p in range(self.parent_roll.LO, self.parent_roll.HI + 1):
             y = (self.parent_roll.HI - p) * self.parent_roll.NH
-            nm = NOTE_NAMES[p % 12]
-            is_black = '#' in nm
-            is_c = p % 12 == 0
-            ik = (p % 12) in in_key
+            pc = p % 12
+            is_black, is_c, nm = _PC_META[pc]
+            ik = (in_key >> pc) & 1
             oct = p // 12 - 1
 
             if is_black:
-                bg = QColor('#2a1a50') if ik else QColor('#111')
+                bg = KEY_BLACK_IN if ik else KEY_BLACK
             else:
-                bg = QColor('#2e2450') if ik else QColor('#16213e')
+                bg = KEY_WHITE_IN if ik else KEY_WHITE
 
             painter.fillRect(0, y, 44, self.parent_roll.NH, bg)
-            painter.setPen(QColor('#1a1a2e'))
+            painter.setPen(KEY_BORDER)
             painter.drawRect(0, y, 44, self.parent_roll.NH)
 
             if is_c:
-                painter.setPen(QColor('#eee'))
-                painter.setFont(QFont('TkDefaultFont', 6))
+                painter.setPen(KEY_C_TEXT)
+                painter.setFont(KEY_C_FONT)
                 painter.drawText(QRect(0, y, 40, self.parent_roll.NH),
                                 Qt.AlignRight | Qt.AlignVCenter, f'C{oct}')
-                painter.setPen(QColor('#533483'))
+                painter.setPen(KEY_C_LINE)
                 painter.drawLine(0, y + self.parent_roll.NH, 44, y + self.parent_roll.NH)
             elif not is_black:
-                painter.setPen(QColor('#888'))
-                painter.setFont(QFont('TkDefaultFont', 5))
+                painter.setPen(KEY_TEXT)
+                painter.setFont(KEY_FONT)
                 painter.drawText(QRect(0, y, 40, self.parent_roll.NH),
                                 Qt.AlignRight | Qt.AlignVCenter, f'{nm}{oct}')
 
+        painter.end()
+        self._pixmap = pm
+        self._pixmap_key = cache_key
+        return pm
+
 
 class PianoGridWidget(QWidget):
     """Note grid for piano roll."""
@@ -623,6 +749,8 @@ class PianoGridWidget(QWidget):
         self.parent_roll = parent
         self._bg_note_fade = {}  # (pitch, pattern_id) -> fade_level (0.0-1.0)
         self._slice_hover_pos = None  # (note_idx, beat) for slice mode preview
+        self._bg_pixmap = None
+        self._bg_key = None
         
         # Enable keyboard focus
         self.setFocusPolicy(Qt.StrongFocus)
@@ -671,39 +799,44 @@ class PianoGridWidget(QWidget):
             self._slice_hover_pos = None
             self.update()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+    def _background(self, pat, s):
+        """Row backgrounds and beat lines, cached as a pixmap.
 
-        pat = self.parent_roll.state.find_pattern(self.parent_roll.state.sel_pat)
-        s = self.parent_roll.state
-        
-        pitch_range = self.parent_roll.HI - self.parent_roll.LO + 1
-        total_h = pitch_range * self.parent_roll.NH
+        They only depend on the pattern's key, scale and length, the time
+        signature, the widget size and the screen's pixel ratio, so note
+        edits and drags just blit the cached layer.
+        """
         beats = pat.length if pat else 16
+        key = (pat.key if pat else None, pat.scale if pat else None, beats,
+               s.ts_num, s.ts_den, self.width(), self.height(),
+               self.devicePixelRatioF())
+        if self._bg_key == key:
+            return self._bg_pixmap
+
         total_w = self.width()
+        total_h = (self.parent_roll.HI - self.parent_roll.LO + 1) * self.parent_roll.NH
+        pm = _device_pixmap(self, ROW_WHITE)
+        painter = QPainter(pm)
+        painter.setRenderHint(QPainter.Antialiasing)
 
-        in_key = scale_set(pat.key, pat.scale) if pat else set()
+        in_key = _in_key_mask(pat)
         bpm_beats = s.ts_num * (4 / s.ts_den)
 
         # Row backgrounds
         for p in range(self.parent_roll.LO, self.parent_roll.HI + 1):
             y = (self.parent_roll.HI - p) * self.parent_roll.NH
-            nm = NOTE_NAMES[p % 12]
-            is_black = '#' in nm
-            is_c = p % 12 == 0
-            ik = (p % 12) in in_key
+            pc = p % 12
+            is_black, is_c, _ = _PC_META[pc]
+            ik = (in_key >> pc) & 1
             
             if is_black:
-                bg = QColor('#1e1a40') if ik else QColor('#15152a')
+                bg = ROW_BLACK_IN if ik else ROW_BLACK
             else:
-                bg = QColor('#252050') if ik else QColor('#1a1a30')
+                bg = ROW_WHITE_IN if ik else ROW_WHITE
             
             painter.fillRect(0, y, total_w, self.parent_roll.NH, bg)
             
-            line_color = QColor('#3a3a6a') if is_c else QColor('#222244')
-            width = 1 if is_c else 0.5
-            painter.setPen(QPen(line_color, width))
+            painter.setPen(ROW_C_PEN if is_c else ROW_PEN)
             painter.drawLine(0, y, total_w, y)
 
         # Beat lines
@@ -715,17 +848,32 @@ class PianoGridWidget(QWidget):
             is_beat = b % 4 == 0
             
             if is_measure:
-                color, width = QColor('#4a4a8a'), 1.5
+                painter.setPen(MEASURE_PEN)
             elif is_beat:
-                color, width = QColor('#3a3a6a'), 1
+                painter.setPen(BEAT_PEN)
             elif b % 2 == 0:
-                color, width = QColor('#2a2a5a'), 0.5
+                painter.setPen(HALF_BEAT_PEN)
             else:
-                color, width = QColor('#222244'), 0.5
-            
-            painter.setPen(QPen(color, width))
+                painter.setPen(SUBDIV_PEN)
             painter.drawLine(int(x), 0, int(x), total_h)
 
+        painter.end()
+        self._bg_pixmap = pm
+        self._bg_key = key
+        return pm
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        pat = self.parent_roll.state.find_pattern(self.parent_roll.state.sel_pat)
+        s = self.parent_roll.state
+        total_w = self.width()
+
+        # Row backgrounds and beat lines
+        rect = event.rect()
+        _blit(painter, rect, self._background(pat, s))
+
         if not pat:
             return
 
@@ -846,32 +994,55 @@ class PianoGridWidget(QWidget):
             from PySide6.QtCore import QTimer
             QTimer.singleShot(33, self.update)
 
-        # Notes from current pattern
+        # Notes from current pattern, unselected then selected, each group in
+        # list order.  Consecutive notes sharing a velocity colour are drawn
+        # as one run (bodies, then their handles and labels); a run is cut
+        # when the colour changes or a note overlaps an earlier one in the
+        # run, so stacking matches drawing the notes one by one.  Notes
+        # outside the exposed rect are skipped.
+        NH = self.parent_roll.NH
+        BW = self.parent_roll.BW
+        HI = self.parent_roll.HI
+        selected = self.parent_roll._selected
+        clip_l, clip_r = rect.left(), rect.right()
+        clip_t, clip_b = rect.top() - NH, rect.bottom()
+        painter.setFont(NOTE_LABEL_FONT)
+        label_fm = painter.fontMetrics()
+        visible = []  # (sel, velocity, body, handle, x_end incl. label)
         for i, n in enumerate(pat.notes):
-            x = n.start * self.parent_roll.BW
-            y = (self.parent_roll.HI - n.pitch) * self.parent_roll.NH
-            w = n.duration * self.parent_roll.BW
-            sel = i in self.parent_roll._selected
-            color = QColor(vel_color(n.velocity))
-
-            if sel:
-                painter.setPen(QPen(QColor('#fff'), 2))
-            else:
-                painter.setPen(QPen(QColor(pat.color), 1))
-            
-            painter.setBrush(color)
-            painter.drawRect(int(x), y + 1, int(w - 1), self.parent_roll.NH - 2)
-
-            # Resize handle
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(QColor(255, 255, 255, 51))
-            painter.drawRect(int(x + w - 4), y + 1, 3, self.parent_roll.NH - 2)
-
-            # Velocity text for selected notes
+            x = n.start * BW
+            y = (HI - n.pitch) * NH
+            w = n.duration * BW
+            if x > clip_r or y < clip_t or y > clip_b:
+                continue
+            sel = i in selected
+            x_end = x + w
             if sel:
-                painter.setPen(QColor('#fff'))
-                painter.setFont(QFont('TkDefaultFont', 6))
-                painter.drawText(int(x + 2), y + self.parent_roll.NH - 3, f'v{n.velocity}')
+                x_end = max(x_end, x + 2 + label_fm.horizontalAdvance(f'v{n.velocity}'))
+            if x_end < clip_l:
+                continue
+            visible.append((sel, n.velocity,
+                            QRect(int(x), y + 1, int(w - 1), NH - 2),
+                            QRect(int(x + w - 4), y + 1, 3, NH - 2), x_end))
+
+        unsel_pen = QPen(QColor(pat.color), 1)
+        for group in (False, True):
+            pen = NOTE_SEL_PEN if group else unsel_pen
+            run_vel = None
+            bodies, handles, row_ends = [], [], {}
+            for sel, vel, body, handle, x_end in visible:
+                if sel is not group:
+                    continue
+                y = body.y()
+                if bodies and (vel != run_vel or row_ends.get(y, body.x()) > body.x()):
+                    _draw_note_run(painter, pen, run_vel, bodies, handles, group)
+                    bodies, handles, row_ends = [], [], {}
+                run_vel = vel
+                bodies.append(body)
+                handles.append(handle)
+                row_ends[y] = max(row_ends.get(y, x_end), x_end)
+            if bodies:
+                _draw_note_run(painter, pen, run_vel, bodies, handles, group)
 
         # Bend curves — drawn on top of all notes
         _in_bend_mode = s.tool == 'bend'
@@ -910,9 +1081,7 @@ class PianoGridWidget(QWidget):
 
                 # Draw smooth curve by sampling
                 from PySide6.QtCore import QLineF
-                curve_color = QColor('#00f5d4')
-                curve_color.setAlpha(200)
-                painter.setPen(QPen(curve_color, 1.5))
+                painter.setPen(BEND_CURVE_PEN)
                 steps = max(16, int(n.duration * 32))
                 prev_cx = note_x0
                 prev_cy = _curve_y(0.0)
@@ -929,14 +1098,13 @@ class PianoGridWidget(QWidget):
                     py = note_y_center - int(semitones / 2.0 * self.parent_roll.NH * 2)
                     is_dragging = (self.parent_roll._bend_drag_note is n and
                                    self.parent_roll._bend_drag_point_idx == pt_idx)
-                    handle_color = QColor('#fee440') if is_dragging else QColor('#00f5d4')
-                    painter.setPen(QPen(QColor('#000'), 1))
-                    painter.setBrush(handle_color)
+                    painter.setPen(BEND_HANDLE_PEN)
+                    painter.setBrush(BEND_HANDLE_DRAG if is_dragging else BEND_HANDLE)
                     painter.drawEllipse(px - 4, py - 4, 8, 8)
 
             elif _in_bend_mode:
                 # In bend mode, show a faint zero-line on notes with no bend yet
-                painter.setPen(QPen(QColor(255, 255, 255, 40), 1, Qt.DashLine))
+                painter.setPen(BEND_ZERO_PEN)
                 nx0 = int(note_x0)
                 nx1 = int(note_x0 + n.duration * self.parent_roll.BW)
                 painter.drawLine(nx0, note_y_center, nx1, note_y_center)
@@ -949,7 +1117,7 @@ class PianoGridWidget(QWidget):
                 x = beat * self.parent_roll.BW
                 y = (self.parent_roll.HI - n.pitch) * self.parent_roll.NH
                 
-                painter.setPen(QPen(QColor('#ff0000'), 2))
+                painter.setPen(SLICE_PEN)
                 painter.drawLine(int(x), y + 1, int(x), y + self.parent_roll.NH - 1)
         
         # Draw marquee selection rectangle
@@ -963,8 +1131,8 @@ class PianoGridWidget(QWidget):
                 abs(cursor_pos.x() - start.x()),
                 abs(cursor_pos.y() - start.y())
             )
-            painter.setPen(QPen(QColor('#ffffff'), 1, Qt.DashLine))
-            painter.setBrush(QColor(255, 255, 255, 30))
+            painter.setPen(MARQUEE_PEN)
+            painter.setBrush(MARQUEE_BRUSH)
             painter.drawRect(rect)
         
         # Draw ghost notes (semi-transparent)
@@ -1000,7 +1168,7 @@ class PianoGridWidget(QWidget):
                     # Draw semi-transparent
                     color = QColor(vel_color(n.velocity))
                     color.setAlpha(128)
-                    painter.setPen(QPen(QColor('#ffffff'), 1, Qt.DashLine))
+                    painter.setPen(GHOST_PEN)
                     painter.setBrush(color)
                     painter.drawRect(int(x), y + 1, int(w - 1), self.parent_roll.NH - 2)
 
@@ -1012,10 +1180,14 @@ class VelocityWidget(QWidget):
         super().__init__(parent)
         self.parent_roll = parent
         self._vel_dragging = False
+        # Note starts sorted for nearest-note lookup during a drag:
+        # (pattern id, note count, [starts], [note indices])
+        self._start_index = None
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self._vel_dragging = True
+            self._start_index = None
             self._set_vel_at(event)
 
     def mouseMoveEvent(self, event):
@@ -1024,6 +1196,36 @@ class VelocityWidget(QWidget):
 
     def mouseReleaseEvent(self, event):
         self._vel_dragging = False
+        self._start_index = None
+
+    def _nearest_note(self, pat, beat):
+        """Index of the note starting closest to ``beat`` (within half a
+        beat), or -1. Ties go to the lowest note index.
+
+        Starts don't move during a velocity drag, so the sorted index is
+        built once per drag and each mouse move is a bisect.
+        """
+        idx = self._start_index
+        if idx is None or idx[0] != pat.id or idx[1] != len(pat.notes):
+            order = sorted(range(len(pat.notes)), key=lambda i: (pat.notes[i].start, i))
+            idx = (pat.id, len(pat.notes),
+                   [pat.notes[i].start for i in order], order)
+            self._start_index = idx
+        starts, order = idx[2], idx[3]
+
+        best = -1
+        best_dist = 0.5
+        j = bisect_left(starts, beat)
+        for k in (j - 1, j):
+            if not 0 <= k < len(starts):
+                continue
+            # First entry with this start holds the lowest note index
+            k = bisect_left(starts, starts[k])
+            d = abs(beat - starts[k])
+            if d < best_dist or (d == best_dist and best >= 0 and order[k] < best):
+                best_dist = d
+                best = order[k]
+        return best
 
     def _set_vel_at(self, event):
         pat = self.parent_roll.state.find_pattern(self.parent_roll.state.sel_pat)
@@ -1045,15 +1247,7 @@ class VelocityWidget(QWidget):
         
         # Otherwise, find nearest note
         beat = x / self.parent_roll.BW
-        
-        best = -1
-        best_dist = float('inf')
-        for i, n in enumerate(pat.notes):
-            d = abs(beat - n.start)
-            if d < best_dist and d < 0.5:
-                best_dist = d
-                best = i
-        
+        best = self._nearest_note(pat, beat)
         if best >= 0:
             pat.notes[best].velocity = vel
             self.parent_roll.refresh()